@@ -0,0 +1,71 @@
+"""add gmail_message_id and gmail_thread_id to email_logs
+
+Revision ID: add_email_log_gmail_ids
+Revises: social_jobs_filters_jsonb
+Create Date: 2026-01-12 12:00:00.000000
+
+The full Gmail API response is no longer stored on every send; the ids
+needed for threading and lookups get their own indexed columns.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_email_log_gmail_ids'
+down_revision = 'social_jobs_filters_jsonb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add gmail id columns and backfill them from stored responses"""
+    from sqlalchemy import inspect
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    if 'email_logs' not in inspector.get_table_names():
+        return
+
+    existing_columns = {col['name'] for col in inspector.get_columns('email_logs')}
+    existing_indexes = {idx['name'] for idx in inspector.get_indexes('email_logs')}
+
+    if 'gmail_message_id' not in existing_columns:
+        op.add_column('email_logs', sa.Column('gmail_message_id', sa.String(255), nullable=True))
+    if 'gmail_thread_id' not in existing_columns:
+        op.add_column('email_logs', sa.Column('gmail_thread_id', sa.String(255), nullable=True))
+
+    # Backfill from the stored Gmail responses before they age out
+    op.execute("""
+        UPDATE email_logs
+        SET gmail_message_id = response->>'message_id',
+            gmail_thread_id = response->>'thread_id'
+        WHERE response IS NOT NULL AND gmail_message_id IS NULL
+    """)
+
+    if 'ix_email_logs_gmail_message_id' not in existing_indexes:
+        op.create_index('ix_email_logs_gmail_message_id', 'email_logs', ['gmail_message_id'])
+    if 'ix_email_logs_gmail_thread_id' not in existing_indexes:
+        op.create_index('ix_email_logs_gmail_thread_id', 'email_logs', ['gmail_thread_id'])
+
+
+def downgrade():
+    """Remove gmail id columns"""
+    from sqlalchemy import inspect
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    if 'email_logs' not in inspector.get_table_names():
+        return
+
+    existing_columns = {col['name'] for col in inspector.get_columns('email_logs')}
+    existing_indexes = {idx['name'] for idx in inspector.get_indexes('email_logs')}
+
+    if 'ix_email_logs_gmail_thread_id' in existing_indexes:
+        op.drop_index('ix_email_logs_gmail_thread_id', 'email_logs')
+    if 'ix_email_logs_gmail_message_id' in existing_indexes:
+        op.drop_index('ix_email_logs_gmail_message_id', 'email_logs')
+    if 'gmail_thread_id' in existing_columns:
+        op.drop_column('email_logs', 'gmail_thread_id')
+    if 'gmail_message_id' in existing_columns:
+        op.drop_column('email_logs', 'gmail_message_id')
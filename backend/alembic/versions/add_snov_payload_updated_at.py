@@ -0,0 +1,46 @@
+"""add snov_payload_updated_at to prospects
+
+Revision ID: add_snov_payload_updated_at
+Revises: add_email_log_gmail_ids
+Create Date: 2026-01-13 12:00:00.000000
+
+Records when enrichment last wrote snov_payload so batch enrichment can skip
+prospects that were enriched recently. Existing rows stay NULL (treated as stale).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_snov_payload_updated_at'
+down_revision = 'add_email_log_gmail_ids'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add snov_payload_updated_at column"""
+    from sqlalchemy import inspect
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    if 'prospects' not in inspector.get_table_names():
+        return
+
+    existing_columns = {col['name'] for col in inspector.get_columns('prospects')}
+    if 'snov_payload_updated_at' not in existing_columns:
+        op.add_column('prospects', sa.Column('snov_payload_updated_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade():
+    """Remove snov_payload_updated_at column"""
+    from sqlalchemy import inspect
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    if 'prospects' not in inspector.get_table_names():
+        return
+
+    existing_columns = {col['name'] for col in inspector.get_columns('prospects')}
+    if 'snov_payload_updated_at' in existing_columns:
+        op.drop_column('prospects', 'snov_payload_updated_at')
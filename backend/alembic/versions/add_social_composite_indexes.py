@@ -0,0 +1,88 @@
+"""add composite indexes for social pipeline queries
+
+Revision ID: add_social_composite_indexes
+Revises: de8b5344821d
+Create Date: 2026-01-12 10:00:00.000000
+
+Indexes are built with CREATE INDEX CONCURRENTLY so writes to the social
+tables are not blocked while the migration runs.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_social_composite_indexes'
+down_revision = 'de8b5344821d'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns)
+COMPOSITE_INDEXES = [
+    ('ix_social_profiles_job_status', 'social_profiles', ['discovery_job_id', 'discovery_status']),
+    ('ix_social_profiles_platform_status', 'social_profiles', ['platform', 'discovery_status']),
+    ('ix_social_messages_profile_status', 'social_messages', ['profile_id', 'status']),
+    ('ix_social_drafts_profile_sequence', 'social_drafts', ['profile_id', 'sequence_index']),
+]
+
+# Single-column index made redundant by the composite indexes above
+REDUNDANT_INDEX = ('ix_social_profiles_discovery_status', 'social_profiles')
+
+
+def _existing_columns(inspector, table):
+    return {col['name'] for col in inspector.get_columns(table)}
+
+
+def upgrade():
+    """Create composite indexes concurrently and drop the redundant status index"""
+    from sqlalchemy import inspect
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    tables = set(inspector.get_table_names())
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in COMPOSITE_INDEXES:
+            if table not in tables:
+                continue
+            if not set(columns).issubset(_existing_columns(inspector, table)):
+                continue
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+        name, table = REDUNDANT_INDEX
+        if table in tables:
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade():
+    """Restore the single-column status index and drop the composite indexes"""
+    from sqlalchemy import inspect
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    tables = set(inspector.get_table_names())
+
+    with op.get_context().autocommit_block():
+        name, table = REDUNDANT_INDEX
+        if table in tables and 'discovery_status' in _existing_columns(inspector, table):
+            op.create_index(
+                name, table, ['discovery_status'],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+        for name, table, _columns in reversed(COMPOSITE_INDEXES):
+            if table in tables:
+                op.drop_index(
+                    name, table_name=table,
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
@@ -0,0 +1,87 @@
+"""convert social_discovery_jobs.filters to jsonb with GIN index
+
+Revision ID: social_jobs_filters_jsonb
+Revises: add_social_composite_indexes
+Create Date: 2026-01-12 11:00:00.000000
+
+json is stored as text and re-parsed on every read; jsonb is stored
+decomposed and supports GIN-indexed containment (@>) lookups.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'social_jobs_filters_jsonb'
+down_revision = 'add_social_composite_indexes'
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = 'ix_social_jobs_filters_gin'
+
+
+def _filters_column(inspector):
+    if 'social_discovery_jobs' not in inspector.get_table_names():
+        return None
+    for col in inspector.get_columns('social_discovery_jobs'):
+        if col['name'] == 'filters':
+            return col
+    return None
+
+
+def upgrade():
+    """Convert filters to jsonb and add a GIN index"""
+    from sqlalchemy import inspect
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    col = _filters_column(inspector)
+    if col is None:
+        return
+
+    if not isinstance(col['type'], postgresql.JSONB):
+        op.alter_column(
+            'social_discovery_jobs', 'filters',
+            type_=postgresql.JSONB(),
+            existing_type=postgresql.JSON(),
+            postgresql_using='filters::jsonb',
+            existing_nullable=True,
+        )
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME, 'social_discovery_jobs', ['filters'],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade():
+    """Drop the GIN index and convert filters back to json"""
+    from sqlalchemy import inspect
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    col = _filters_column(inspector)
+    if col is None:
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME, table_name='social_discovery_jobs',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    if isinstance(col['type'], postgresql.JSONB):
+        op.alter_column(
+            'social_discovery_jobs', 'filters',
+            type_=postgresql.JSON(),
+            existing_type=postgresql.JSONB(),
+            postgresql_using='filters::json',
+            existing_nullable=True,
+        )
@@ -19,8 +19,7 @@ from app.models.prospect import (
     VerificationStatus,
     ProspectStage,
 )
-from app.services.enrichment import _scrape_emails_from_domain
-from app.clients.snov import SnovIOClient
+from app.services.enrichment import _scrape_emails_from_domain, _verification_domain_search
 
 logger = logging.getLogger(__name__)
 
@@ -266,10 +265,8 @@ async def manual_verify(
     
     # Run Snov verification
     try:
-        snov_client = SnovIOClient()
-        
-        # Use domain search to verify email
-        snov_result = await snov_client.domain_search(domain)
+        # Use domain search to verify email (short-lived verification cache)
+        snov_result = await _verification_domain_search(domain)
         
         if snov_result.get("success") and snov_result.get("emails"):
             # Check if email is in Snov results
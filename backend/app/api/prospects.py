@@ -149,7 +149,7 @@ async def enrich_prospect_by_id(
             logger.warning(f"⚠️  [ENRICHMENT API] Enriching prospect {prospect_id} with non-partner intent: {prospect.serp_intent}")
         
         # STRICT MODE: Enrich using domain and page_url
-        from app.services.enrichment import enrich_prospect_email
+        from app.services.enrichment import enrich_prospect_email, _enrichment_payload_columns
         enrich_result = await enrich_prospect_email(prospect.domain, None, prospect.page_url)
         
         if not enrich_result:
@@ -160,7 +160,6 @@ async def enrich_prospect_by_id(
                 "primary_email": None,
                 "email_status": "no_email_found",
                 "pages_crawled": [],
-                "emails_by_page": {},
                 "snov_emails_accepted": 0,
                 "snov_emails_rejected": 0,
                 "success": False,
@@ -175,7 +174,8 @@ async def enrich_prospect_by_id(
             # Email found on website - update prospect
             prospect.contact_email = primary_email
             prospect.contact_method = enrich_result.get("source", "html_scraping")
-            prospect.snov_payload = enrich_result
+            for column, value in _enrichment_payload_columns(enrich_result).items():
+                setattr(prospect, column, value)
             await db.commit()
             await db.refresh(prospect)
             
@@ -195,7 +195,8 @@ async def enrich_prospect_by_id(
             # No email found on website - store "no_email_found" status
             prospect.contact_email = None
             prospect.contact_method = "no_email_found"
-            prospect.snov_payload = enrich_result
+            for column, value in _enrichment_payload_columns(enrich_result).items():
+                setattr(prospect, column, value)
             await db.commit()
             await db.refresh(prospect)
             
@@ -256,7 +256,10 @@ async def test_service(service_name: str):
                 }
             client = GmailClient(client_id=client_id, client_secret=client_secret, refresh_token=refresh_token)
             # Test by refreshing token (which validates credentials)
-            success = await client.refresh_access_token()
+            try:
+                success = await client.refresh_access_token()
+            finally:
+                await client.aclose()
             if success:
                 return {
                     "success": True,
@@ -44,6 +44,21 @@ class GmailClient:
         
         if not self.access_token and not self.refresh_token:
             raise ValueError("Gmail credentials not configured. Set GMAIL_ACCESS_TOKEN or GMAIL_REFRESH_TOKEN")
+        
+        # Shared HTTP client - created lazily so TCP+TLS connections are reused across calls
+        self._http_client: Optional[httpx.AsyncClient] = None
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get (or create) the pooled HTTP client used for all Gmail/OAuth calls"""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(timeout=30.0)
+        return self._http_client
+    
+    async def aclose(self):
+        """Close the pooled HTTP client"""
+        if self._http_client is not None and not self._http_client.is_closed:
+            await self._http_client.aclose()
+        self._http_client = None
     
     def is_configured(self) -> bool:
         """Check if client is properly configured"""
@@ -70,40 +85,40 @@ class GmailClient:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                logger.debug(f"Refreshing Gmail access token with client_id: {self.client_id[:20]}...")
-                response = await client.post(url, data=payload)
+            client = self._get_http_client()
+            logger.debug(f"Refreshing Gmail access token with client_id: {self.client_id[:20]}...")
+            response = await client.post(url, data=payload)
                 
-                # Log response status for debugging
-                logger.debug(f"Token refresh response status: {response.status_code}")
+            # Log response status for debugging
+            logger.debug(f"Token refresh response status: {response.status_code}")
                 
-                if response.status_code != 200:
-                    error_text = response.text
-                    logger.error(f"Token refresh failed with status {response.status_code}: {error_text}")
-                    # Provide more helpful error messages
-                    if response.status_code == 400:
-                        try:
-                            error_json = response.json()
-                            error_detail = error_json.get("error_description", error_text)
-                            if "invalid_grant" in error_detail.lower():
-                                logger.error("❌ Invalid refresh token - token may be expired or revoked. Please generate a new refresh token.")
-                            elif "invalid_client" in error_detail.lower():
-                                logger.error("❌ Invalid client credentials - check GMAIL_CLIENT_ID and GMAIL_CLIENT_SECRET")
-                        except:
-                            pass
-                    return False
+            if response.status_code != 200:
+                error_text = response.text
+                logger.error(f"Token refresh failed with status {response.status_code}: {error_text}")
+                # Provide more helpful error messages
+                if response.status_code == 400:
+                    try:
+                        error_json = response.json()
+                        error_detail = error_json.get("error_description", error_text)
+                        if "invalid_grant" in error_detail.lower():
+                            logger.error("❌ Invalid refresh token - token may be expired or revoked. Please generate a new refresh token.")
+                        elif "invalid_client" in error_detail.lower():
+                            logger.error("❌ Invalid client credentials - check GMAIL_CLIENT_ID and GMAIL_CLIENT_SECRET")
+                    except:
+                        pass
+                return False
                 
-                response.raise_for_status()
-                result = response.json()
+            response.raise_for_status()
+            result = response.json()
                 
-                self.access_token = result.get("access_token")
-                if self.access_token:
-                    logger.info("✅ Gmail access token refreshed successfully")
-                    return True
-                else:
-                    logger.error("Failed to refresh token: no access_token in response")
-                    logger.error(f"Response: {result}")
-                    return False
+            self.access_token = result.get("access_token")
+            if self.access_token:
+                logger.info("✅ Gmail access token refreshed successfully")
+                return True
+            else:
+                logger.error("Failed to refresh token: no access_token in response")
+                logger.error(f"Response: {result}")
+                return False
         
         except httpx.HTTPStatusError as e:
             error_text = e.response.text if e.response else "No response text"
@@ -177,29 +192,29 @@ class GmailClient:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                logger.info(f"Sending email via Gmail API to: {to_email}")
-                response = await client.post(url, headers=headers, json=payload)
+            client = self._get_http_client()
+            logger.info(f"Sending email via Gmail API to: {to_email}")
+            response = await client.post(url, headers=headers, json=payload)
                 
-                # If unauthorized, try refreshing token
-                if response.status_code == 401:
-                    logger.warning("Gmail API returned 401, attempting token refresh")
-                    if await self.refresh_access_token():
-                        headers["Authorization"] = f"Bearer {self.access_token}"
-                        response = await client.post(url, headers=headers, json=payload)
+            # If unauthorized, try refreshing token
+            if response.status_code == 401:
+                logger.warning("Gmail API returned 401, attempting token refresh")
+                if await self.refresh_access_token():
+                    headers["Authorization"] = f"Bearer {self.access_token}"
+                    response = await client.post(url, headers=headers, json=payload)
                 
-                response.raise_for_status()
-                result = response.json()
+            response.raise_for_status()
+            result = response.json()
                 
-                message_id = result.get("id")
-                logger.info(f"✅ Email sent successfully. Message ID: {message_id}")
+            message_id = result.get("id")
+            logger.info(f"✅ Email sent successfully. Message ID: {message_id}")
                 
-                return {
-                    "success": True,
-                    "message_id": message_id,
-                    "thread_id": result.get("threadId"),
-                    "raw_response": result
-                }
+            return {
+                "success": True,
+                "message_id": message_id,
+                "thread_id": result.get("threadId"),
+                "raw_response": result
+            }
         
         except httpx.HTTPStatusError as e:
             error_text = e.response.text
@@ -252,13 +267,13 @@ class GmailClient:
         headers = {"Authorization": f"Bearer {self.access_token}"}
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                return {
-                    "success": True,
-                    "profile": response.json()
-                }
+            client = self._get_http_client()
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+            return {
+                "success": True,
+                "profile": response.json()
+            }
         except Exception as e:
             logger.error(f"Failed to get Gmail profile: {str(e)}")
             return {"success": False, "error": str(e)}
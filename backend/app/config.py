@@ -0,0 +1,40 @@
+"""
+Application settings
+
+Environment configuration is parsed once into a cached Settings object
+instead of re-reading .env and calling os.getenv() in every module.
+"""
+from functools import lru_cache
+from typing import Optional
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """Process-wide settings (read from environment, then .env)"""
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    # Database
+    database_url: Optional[str] = None
+    supabase_ipv4: Optional[str] = None  # IPv4 fallback when DNS resolution fails
+
+    # Connection pool - tune per deployment (workers x concurrency)
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_timeout: int = 10
+    db_pool_recycle: int = 1800
+    db_pre_ping_idle_seconds: int = 60  # Ping on checkout only after this much idle time
+
+    # Debug mode - retains full third-party API responses (e.g. Gmail send envelopes)
+    debug: bool = False
+
+    # SQL statement logging (opt-in)
+    sql_echo: bool = False
+
+    # Redis (optional - provider state falls back to in-memory storage)
+    redis_url: Optional[str] = None
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Get the cached Settings instance"""
+    return Settings()
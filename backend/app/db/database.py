@@ -5,21 +5,24 @@ ISOLATED: Engine creation is lazy to prevent conflicts with Alembic imports.
 """
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy import event, exc
 from typing import AsyncGenerator
-import os
 import sys
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except Exception:
-    pass  # Continue without .env if it has issues
+import time
 import logging
+from app.config import get_settings
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 # Database URL from environment
 # Render provides postgresql:// but we need postgresql+asyncpg:// for async SQLAlchemy
-raw_database_url = os.getenv("DATABASE_URL")
+raw_database_url = get_settings().database_url
 
 if not raw_database_url:
     logger.warning("DATABASE_URL environment variable not set! Using default local database.")
@@ -262,6 +265,41 @@ def get_engine():
     """Get the single async engine instance (public API)"""
     return _get_engine()
 
+def _json_serializer(value) -> str:
+    """JSON column serializer - orjson when installed (much faster than stdlib json)"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _install_idle_pre_ping(async_engine, idle_seconds: int) -> None:
+    """
+    Ping pooled connections on checkout only if they sat idle longer than idle_seconds.
+    
+    Replaces pool_pre_ping=True, which issues a SELECT 1 round-trip on every
+    checkout. Recently used connections are handed out as-is; stale ones are
+    pinged and, if dead, discarded so the pool transparently reconnects.
+    """
+    sync_engine = async_engine.sync_engine
+    
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        connection_record.info["last_used"] = time.monotonic()
+    
+    @event.listens_for(sync_engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        connection_record.info["last_used"] = time.monotonic()
+    
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        idle_for = time.monotonic() - connection_record.info.get("last_used", 0)
+        if idle_for <= idle_seconds:
+            return
+        try:
+            sync_engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            logger.warning(f"⚠️  Stale pooled connection (idle {idle_for:.0f}s) failed ping, reconnecting: {e}")
+            # Pool discards this connection and retries checkout with a fresh one
+            raise exc.DisconnectionError() from e
+
 def _resolve_to_ipv4_sync(url: str) -> str:
     """
     Resolve Supabase hostname to IPv4 address synchronously.
@@ -358,7 +396,7 @@ def _resolve_to_ipv4_sync(url: str) -> str:
                         logger.error(f"❌ Fallback DNS resolution also failed: {fallback_err}")
                         
                         # Last last resort: Check if SUPABASE_IPV4 env var is set
-                        fallback_ip = os.getenv("SUPABASE_IPV4")
+                        fallback_ip = get_settings().supabase_ipv4
                         if fallback_ip:
                             logger.warning(f"⚠️  Using SUPABASE_IPV4 environment variable: {fallback_ip}")
                             resolved_url = f"{scheme_part}{creds_part}@{fallback_ip}:{port}{path_part}"
@@ -390,7 +428,7 @@ def _resolve_to_ipv4_sync(url: str) -> str:
         
         # Final check: SUPABASE_IPV4 env var as absolute last resort
         # Extract port and path again in case we're here from timeout/other errors
-        fallback_ip = os.getenv("SUPABASE_IPV4")
+        fallback_ip = get_settings().supabase_ipv4
         if fallback_ip:
             logger.warning(f"⚠️  All DNS resolution attempts failed. Using SUPABASE_IPV4 environment variable: {fallback_ip}")
             # Re-extract components to build URL
@@ -485,7 +523,29 @@ def _get_engine():
                     else:
                         connect_args["timeout"] = 20  # 20 seconds for direct connection
                         logger.info("⏱️  Connection timeout set to 20s for direct connection")
-                
+
+                # Server-side tuning for asyncpg: disable JIT (short OLTP queries pay
+                # JIT compile cost for nothing) and cache prepared statements per connection.
+                # Transaction-mode poolers (pgbouncer / Supabase :6543) cannot use prepared
+                # statements across transactions, so keep the statement cache off there.
+                connect_args.setdefault("server_settings", {"jit": "off"})
+                if ":6543" in DATABASE_URL or "pgbouncer=true" in DATABASE_URL.lower():
+                    connect_args.setdefault("statement_cache_size", 0)
+                else:
+                    connect_args.setdefault("statement_cache_size", 1024)
+
+                # Pool sizing - tune per deployment via env (workers x concurrency)
+                settings = get_settings()
+                pool_size = settings.db_pool_size
+                max_overflow = settings.db_max_overflow
+                pool_timeout = settings.db_pool_timeout
+                pool_recycle = settings.db_pool_recycle
+                pre_ping_idle = settings.db_pre_ping_idle_seconds
+                logger.info(
+                    f"🏊 Pool config: size={pool_size}, max_overflow={max_overflow}, "
+                    f"timeout={pool_timeout}s, recycle={pool_recycle}s, pre_ping_idle={pre_ping_idle}s"
+                )
+
                 # Log connection details for debugging
                 if "@" in DATABASE_URL:
                     connection_target = DATABASE_URL.split("@")[1].split("/")[0]
@@ -506,16 +566,26 @@ def _get_engine():
                     else:
                         logger.warning(f"⚠️  Unknown port in connection target: {connection_target}")
                 
+                engine_kwargs = {}
+                if ORJSON_AVAILABLE:
+                    engine_kwargs["json_serializer"] = _json_serializer
+                
+                # SQL statement logging is opt-in (SQL_ECHO=1) - echoing every
+                # statement + bound params is far too expensive for the request path
                 _engine_instance = create_async_engine(
                     DATABASE_URL,
-                    echo=False,
+                    echo=settings.sql_echo,
+                    echo_pool=False,
                     future=True,
-                    pool_pre_ping=True,
-                    pool_size=10,
-                    max_overflow=20,
-                    pool_timeout=30,  # Wait up to 30s for connection from pool
-                    connect_args=connect_args
+                    pool_recycle=pool_recycle,  # Recycle connections before DB/proxy idle timeouts kill them
+                    pool_size=pool_size,
+                    max_overflow=max_overflow,
+                    pool_timeout=pool_timeout,  # Fail fast instead of queueing on an exhausted pool
+                    connect_args=connect_args,
+                    **engine_kwargs
                 )
+                # Liveness check only for connections idle past the threshold (see _install_idle_pre_ping)
+                _install_idle_pre_ping(_engine_instance, pre_ping_idle)
                 logger.info("✅ Async engine created successfully")
     return _engine_instance
 
@@ -584,12 +654,14 @@ Base = declarative_base()
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for getting database session
+
+    Does NOT commit on exit - endpoints/services that write must call
+    `await db.commit()` explicitly. Read-only requests skip the COMMIT round-trip.
     """
     try:
         async with AsyncSessionLocal() as session:
             try:
                 yield session
-                await session.commit()
             except Exception as e:
                 await session.rollback()
                 logger.error(f"Database session error: {e}", exc_info=True)
@@ -598,7 +670,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
                 await session.close()
     except Exception as e:
         logger.error(f"Failed to create database session: {e}", exc_info=True)
-        logger.error(f"DATABASE_URL is set: {bool(os.getenv('DATABASE_URL'))}")
+        logger.error(f"DATABASE_URL is set: {bool(get_settings().database_url)}")
         if "@" in DATABASE_URL:
             try:
                 parts = DATABASE_URL.split("@")
@@ -1,6 +1,12 @@
 """
 FastAPI application entry point
 """
+# Load .env once at app entry, before any app module reads the environment
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except Exception:
+    pass  # Continue without .env if it has issues
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -432,7 +438,6 @@ async def startup():
                             FROM information_schema.columns 
                             WHERE table_name = 'prospects' 
                             AND column_name IN ('source_type', 'source_platform', 'profile_url', 'username', 'display_name', 'follower_count', 'engagement_rate')
-                            ORDER BY column_name
                         """)
                     )
                     existing_columns = {row[0] for row in result.fetchall()}
@@ -942,18 +947,16 @@ async def startup():
     # Use the schema validator to check if all required columns exist
     schema_valid = False
     try:
-        from app.utils.schema_validator import validate_prospect_schema
-        from app.db.database import AsyncSessionLocal
+        from app.utils.schema_validator import validate_all, SchemaValidationError
         
-        async with AsyncSessionLocal() as db_session:
-            validation_result = await validate_prospect_schema(db_session)
-            if validation_result.get("valid", False):
-                logger.info("✅ Database schema validated - All required columns present")
-                schema_valid = True
-            else:
-                missing = validation_result.get("missing_columns", [])
-                logger.warning(f"⚠️  Some columns missing: {', '.join(missing)}")
-                schema_valid = False
+        try:
+            await validate_all(engine)
+            logger.info("✅ Database schema validated - All required columns and tables present")
+            schema_valid = True
+        except SchemaValidationError as validation_failed:
+            for failure in validation_failed.failures:
+                logger.warning(f"⚠️  Schema validation: {failure}")
+            schema_valid = False
     except Exception as validation_error:
         logger.error("=" * 80)
         logger.error("❌ CRITICAL: Schema validation check failed")
@@ -984,10 +987,29 @@ async def startup():
 
 @app.on_event("shutdown")
 async def shutdown():
-    """Shutdown event - stop scheduler"""
+    """Shutdown event - stop scheduler, close shared HTTP clients, release DB pool"""
     try:
         from app.scheduler import stop_scheduler
         stop_scheduler()
     except Exception as e:
         logger.warning(f"Error stopping scheduler: {e}")
+    
+    try:
+        from app.services.email_sender import _close_gmail_client
+        await _close_gmail_client()
+    except Exception as e:
+        logger.warning(f"Error closing Gmail client: {e}")
+    
+    try:
+        from app.services.enrichment import _close_scrape_client
+        await _close_scrape_client()
+    except Exception as e:
+        logger.warning(f"Error closing scraping client: {e}")
+    
+    # Dispose after the scheduler is stopped so no job can check out a new connection
+    try:
+        await engine.dispose()
+        logger.info("✅ Database engine disposed")
+    except Exception as e:
+        logger.warning(f"Error disposing database engine: {e}")
 
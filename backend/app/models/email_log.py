@@ -17,7 +17,9 @@ class EmailLog(Base):
     prospect_id = Column(UUID(as_uuid=True), ForeignKey("prospects.id"), nullable=False, index=True)
     subject = Column(Text)
     body = Column(Text)
-    response = Column(JSON)  # Gmail API response
+    gmail_message_id = Column(String(255), nullable=True, index=True)
+    gmail_thread_id = Column(String(255), nullable=True, index=True)
+    response = Column(JSON)  # Full Gmail API response - only stored when DEBUG is enabled
     sent_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     
     # Relationship
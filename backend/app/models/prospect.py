@@ -164,6 +164,7 @@ class Prospect(Base):
     # Raw API responses (kept for backward compatibility)
     dataforseo_payload = Column(JSON)  # Raw DataForSEO response
     snov_payload = Column(JSON)  # Raw Snov.io response
+    snov_payload_updated_at = Column(DateTime(timezone=True), nullable=True)  # When enrichment last wrote snov_payload
     
     # SERP intent (from previous implementation)
     serp_intent = Column(String)  # SERP intent: service, brand, blog, media, marketplace, platform, unknown
@@ -5,13 +5,13 @@ COMPLETELY SEPARATE from Website Outreach - parallel system with no shared logic
 
 Targets individual people (not organizations) across LinkedIn, Facebook, Instagram, TikTok.
 """
-from sqlalchemy import Column, String, Text, Integer, Boolean, JSON, DateTime, ForeignKey, Enum as SQLEnum, Float, ARRAY
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Text, Integer, Boolean, JSON, DateTime, ForeignKey, Enum as SQLEnum, Float, ARRAY, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-import uuid
 from enum import Enum
 from app.db.database import Base
+from app.utils.ids import uuid7
 
 
 class SocialPlatform(str, Enum):
@@ -69,8 +69,13 @@ class SocialProfile(Base):
     SEPARATE from Prospect model - targets people, not organizations.
     """
     __tablename__ = "social_profiles"
+    __table_args__ = (
+        # Hot pipeline lookups: profiles for a job by status, profiles for a platform by status
+        Index("ix_social_profiles_job_status", "discovery_job_id", "discovery_status"),
+        Index("ix_social_profiles_platform_status", "platform", "discovery_status"),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     
     # Platform identification
     platform = Column(SQLEnum(SocialPlatform), nullable=False, index=True)
@@ -91,9 +96,8 @@ class SocialProfile(Base):
     discovery_status = Column(
         SQLEnum(DiscoveryStatus),
         nullable=False,
-        server_default=DiscoveryStatus.DISCOVERED.value,
-        index=True
-    )
+        server_default=DiscoveryStatus.DISCOVERED.value
+    )  # Indexed via composite indexes in __table_args__
     outreach_status = Column(
         SQLEnum(OutreachStatus),
         nullable=False,
@@ -123,8 +127,12 @@ class SocialDiscoveryJob(Base):
     Platform-specific parameters stored in JSONB.
     """
     __tablename__ = "social_discovery_jobs"
+    __table_args__ = (
+        # Containment lookups on filters (e.g. filters @> '{"hashtags": ["art"]}')
+        Index("ix_social_jobs_filters_gin", "filters", postgresql_using="gin"),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     platform = Column(SQLEnum(SocialPlatform), nullable=False, index=True)
     
     # Search parameters
@@ -136,7 +144,7 @@ class SocialDiscoveryJob(Base):
     parameters = Column(JSON, nullable=True)  # Platform-specific: job_title, industry, hashtags, etc.
     
     # Legacy field (kept for backward compatibility)
-    filters = Column(JSON, nullable=True)  # Alias for parameters
+    filters = Column(JSONB, nullable=True)  # Alias for parameters
     payload = Column(JSON, nullable=True)  # Alias for parameters
     
     # Job status
@@ -165,8 +173,11 @@ class SocialDraft(Base):
     Drafts are saved but not sent until explicitly sent from Sending stage.
     """
     __tablename__ = "social_drafts"
+    __table_args__ = (
+        Index("ix_social_drafts_profile_sequence", "profile_id", "sequence_index"),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     profile_id = Column(UUID(as_uuid=True), ForeignKey("social_profiles.id"), nullable=False, index=True)
     platform = Column(SQLEnum(SocialPlatform), nullable=False)
     
@@ -190,8 +201,12 @@ class SocialMessage(Base):
     Tracks message history per profile for follow-up generation.
     """
     __tablename__ = "social_messages"
+    __table_args__ = (
+        # Follow-up drafting looks up sent messages per profile
+        Index("ix_social_messages_profile_status", "profile_id", "status"),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     profile_id = Column(UUID(as_uuid=True), ForeignKey("social_profiles.id"), nullable=False, index=True)
     platform = Column(SQLEnum(SocialPlatform), nullable=False)
     
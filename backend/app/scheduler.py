@@ -4,18 +4,24 @@ Scheduler for periodic tasks (follow-ups, reply checks, automatic scraper)
 import logging
 import asyncio
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.executors.asyncio import AsyncIOExecutor
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
-import os
-from dotenv import load_dotenv
 import time
 from datetime import datetime, timezone
 
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
-scheduler = AsyncIOScheduler()
+# coalesce + max_instances=1: a late or slow tick collapses into a single run
+# instead of piling up overlapping instances
+scheduler = AsyncIOScheduler(
+    executors={"default": AsyncIOExecutor()},
+    job_defaults={
+        "coalesce": True,
+        "max_instances": 1,
+        "misfire_grace_time": 300,
+    }
+)
 
 
 def schedule_followups():
@@ -173,7 +179,8 @@ def start_scheduler():
         trigger=IntervalTrigger(minutes=1),
         id="scraper_check",
         name="Check and Run Automatic Scraper",
-        max_instances=1  # Prevent overlapping runs
+        max_instances=1,  # Prevent overlapping runs
+        replace_existing=True
     )
     
     # Schedule follow-ups daily at 9 AM
@@ -181,7 +188,8 @@ def start_scheduler():
         schedule_followups,
         trigger=CronTrigger(hour=9, minute=0),
         id="daily_followups",
-        name="Daily Follow-up Emails"
+        name="Daily Follow-up Emails",
+        replace_existing=True
     )
     
     # Schedule reply checks every 6 hours
@@ -189,7 +197,8 @@ def start_scheduler():
         schedule_reply_check,
         trigger=IntervalTrigger(hours=6),
         id="reply_checks",
-        name="Check for Email Replies"
+        name="Check for Email Replies",
+        replace_existing=True
     )
     
     scheduler.start()
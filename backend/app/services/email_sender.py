@@ -2,92 +2,137 @@
 Shared email sending service
 Used by both pipeline send and manual send endpoints
 """
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+import os
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
 from datetime import datetime, timezone
+from sqlalchemy import update, insert, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 from app.models.prospect import Prospect, SendStatus
 from app.models.email_log import EmailLog
 from app.clients.gmail import GmailClient
+from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Process-wide Gmail client - reuses OAuth token and pooled HTTP connections across sends.
+# Keyed on the credentials it was built from, so a credential change rebuilds it.
+_GMAIL_CREDENTIAL_ENV = ("GMAIL_ACCESS_TOKEN", "GMAIL_REFRESH_TOKEN", "GMAIL_CLIENT_ID", "GMAIL_CLIENT_SECRET")
+_gmail_client: Optional[GmailClient] = None
+_gmail_client_key: Optional[Tuple[Optional[str], ...]] = None
+_gmail_client_lock = asyncio.Lock()
 
-async def send_prospect_email(
-    prospect: Prospect,
-    db: AsyncSession,
-    gmail_client: Optional[GmailClient] = None
-) -> Dict[str, Any]:
+
+def _validate_sendable(prospect: Prospect) -> Tuple[str, str]:
     """
-    Send email for a single prospect using Gmail API.
-    
-    This is the canonical send logic used by both:
-    - Pipeline send (batch)
-    - Manual send (individual)
-    
-    Args:
-        prospect: Prospect model instance
-        db: Database session
-        gmail_client: Optional Gmail client (will create if not provided)
-        
-    Returns:
-        Dict with 'success' (bool) and 'message_id' or 'error'
-        
+    Validate prospect is sendable and return (subject, body).
+
     Raises:
         ValueError: If prospect is not sendable
-        Exception: If Gmail send fails
     """
-    # Validate prospect is sendable
     if not prospect.contact_email:
         raise ValueError("Prospect has no contact email")
-    
+
     if not prospect.draft_subject or not prospect.draft_body:
         raise ValueError("Prospect has no draft email (draft_subject and draft_body required)")
-    
+
     if prospect.send_status == SendStatus.SENT.value:
         raise ValueError("Email already sent for this prospect")
-    
+
     # Get email content - use draft_body (final_body is set after sending)
-    subject = prospect.draft_subject
-    body = prospect.draft_body
-    
-    if not subject or not body:
-        raise ValueError("Prospect has no draft email (draft_subject and draft_body required)")
-    
-    # Initialize Gmail client if not provided
-    if not gmail_client:
-        try:
-            logger.info("🔧 [SEND] Initializing Gmail client...")
-            gmail_client = GmailClient()
-            
-            # Verify client is properly configured
-            if not gmail_client.is_configured():
+    return prospect.draft_subject, prospect.draft_body
+
+
+async def _init_gmail_client() -> GmailClient:
+    """
+    Create and verify a Gmail client from environment configuration.
+
+    Raises:
+        ValueError: If Gmail is not configured or the refresh token is invalid
+    """
+    try:
+        logger.info("🔧 [SEND] Initializing Gmail client...")
+        gmail_client = GmailClient()
+
+        # Verify client is properly configured
+        if not gmail_client.is_configured():
+            raise ValueError(
+                "Gmail client is not properly configured. "
+                "Set GMAIL_ACCESS_TOKEN or (GMAIL_REFRESH_TOKEN + GMAIL_CLIENT_ID + GMAIL_CLIENT_SECRET) environment variables."
+            )
+
+        # If using refresh token, test that it works
+        if gmail_client.refresh_token and not gmail_client.access_token:
+            logger.info("🔄 [SEND] Testing refresh token...")
+            if not await gmail_client.refresh_access_token():
                 raise ValueError(
-                    "Gmail client is not properly configured. "
-                    "Set GMAIL_ACCESS_TOKEN or (GMAIL_REFRESH_TOKEN + GMAIL_CLIENT_ID + GMAIL_CLIENT_SECRET) environment variables."
+                    "Gmail refresh token is invalid or expired. "
+                    "Please generate a new refresh token from Google OAuth Playground or re-authenticate."
                 )
-            
-            # If using refresh token, test that it works
-            if gmail_client.refresh_token and not gmail_client.access_token:
-                logger.info("🔄 [SEND] Testing refresh token...")
-                if not await gmail_client.refresh_access_token():
-                    raise ValueError(
-                        "Gmail refresh token is invalid or expired. "
-                        "Please generate a new refresh token from Google OAuth Playground or re-authenticate."
-                    )
-            
-            logger.info("✅ [SEND] Gmail client initialized successfully")
-        except ValueError as e:
-            error_msg = str(e)
-            logger.error(f"❌ [SEND] Gmail client initialization failed: {error_msg}")
-            raise ValueError(error_msg)
-        except Exception as e:
-            logger.error(f"❌ [SEND] Unexpected error initializing Gmail client: {e}", exc_info=True)
-            raise ValueError(f"Gmail configuration error: {str(e)}")
-    
-    # Send email via Gmail API
-    logger.info(f"📧 [SEND] Sending email to {prospect.contact_email} (prospect_id: {prospect.id})...")
+
+        logger.info("✅ [SEND] Gmail client initialized successfully")
+        return gmail_client
+    except ValueError as e:
+        error_msg = str(e)
+        logger.error("❌ [SEND] Gmail client initialization failed: %s", error_msg)
+        raise ValueError(error_msg)
+    except Exception as e:
+        logger.error("❌ [SEND] Unexpected error initializing Gmail client: %s", e, exc_info=True)
+        raise ValueError(f"Gmail configuration error: {str(e)}")
+
+
+def _gmail_credentials_key() -> Tuple[Optional[str], ...]:
+    """Gmail credentials currently in the environment (what GmailClient() reads)"""
+    return tuple(os.getenv(name) for name in _GMAIL_CREDENTIAL_ENV)
+
+
+async def _get_gmail_client() -> GmailClient:
+    """
+    Get (or lazily create) the shared Gmail client.
     
+    Rebuilt when the Gmail credentials in the environment change, so a new
+    token or OAuth client takes effect without a restart. The replaced
+    client's HTTP pool is closed.
+    """
+    global _gmail_client, _gmail_client_key
+    key = _gmail_credentials_key()
+    if _gmail_client is None or _gmail_client_key != key:
+        async with _gmail_client_lock:
+            if _gmail_client is None or _gmail_client_key != key:
+                stale_client = _gmail_client
+                _gmail_client = await _init_gmail_client()
+                _gmail_client_key = key
+                if stale_client is not None:
+                    logger.info("🔄 [SEND] Gmail credentials changed - rebuilt shared Gmail client")
+                    await stale_client.aclose()
+    return _gmail_client
+
+
+async def _close_gmail_client():
+    """Close the shared Gmail client (called on application shutdown)"""
+    global _gmail_client, _gmail_client_key
+    if _gmail_client is not None:
+        await _gmail_client.aclose()
+        _gmail_client = None
+        _gmail_client_key = None
+
+
+async def _send_via_gmail(
+    prospect: Prospect,
+    subject: str,
+    body: str,
+    gmail_client: GmailClient
+) -> Dict[str, Any]:
+    """
+    Send a single email via Gmail API and return the successful send result.
+
+    Raises:
+        Exception: If the Gmail API call fails or returns an error
+    """
+    logger.info("📧 [SEND] Sending email to %s (prospect_id: %s)...", prospect.contact_email, prospect.id)
+
     try:
         send_result = await gmail_client.send_email(
             to_email=prospect.contact_email,
@@ -95,65 +140,185 @@ async def send_prospect_email(
             body=body
         )
     except Exception as send_err:
-        logger.error(f"❌ [SEND] Gmail API call failed: {send_err}", exc_info=True)
+        logger.error("❌ [SEND] Gmail API call failed: %s", send_err, exc_info=True)
         raise Exception(f"Failed to send email via Gmail: {send_err}")
-    
+
     if not send_result.get("success"):
         error_msg = send_result.get('error', 'Unknown error')
         error_detail = send_result.get('error_detail', error_msg)
-        status_code = send_result.get('status_code')
-        
-        logger.error(f"❌ [SEND] Gmail returned error: {error_msg}")
+
+        logger.error("❌ [SEND] Gmail returned error: %s", error_msg)
         if error_detail and error_detail != error_msg:
-            logger.error(f"❌ [SEND] Error details: {error_detail}")
-        
+            logger.error("❌ [SEND] Error details: %s", error_detail)
+
         # Provide structured error message
         full_error = f"Gmail API error: {error_msg}"
         if error_detail and error_detail != error_msg:
             full_error += f"\n\n{error_detail}"
-        
+
         raise Exception(full_error)
-    
-    # Create email log
-    email_log = EmailLog(
-        prospect_id=prospect.id,
-        subject=subject,
-        body=body,
-        response=send_result
-    )
-    db.add(email_log)
-    
-    # Update prospect: move draft_body to final_body, set sent_at, update status
-    # Move draft to final_body after sending (preserves sent email content)
-    prospect.final_body = prospect.draft_body
-    
-    # Clear draft after sending (but keep final_body)
-    prospect.draft_body = None
-    prospect.draft_subject = None
-    
-    prospect.last_sent = datetime.now(timezone.utc)
-    prospect.send_status = SendStatus.SENT.value
-    prospect.outreach_status = "sent"  # Legacy field
-    
-    # Increment follow-up sequence index if this is a follow-up
+
+    return send_result
+
+
+def _next_sequence_index(prospect: Prospect) -> Optional[int]:
+    """Follow-up sequence index after sending (unchanged for initial emails)"""
     if prospect.sequence_index and prospect.sequence_index > 0:
         # This is already a follow-up, increment
-        prospect.sequence_index += 1
-    elif prospect.thread_id and prospect.thread_id != prospect.id:
+        return prospect.sequence_index + 1
+    if prospect.thread_id and prospect.thread_id != prospect.id:
         # This is a follow-up (thread_id != own id), set sequence_index to 1
-        prospect.sequence_index = 1
-    
-    # Commit changes
-    await db.commit()
-    await db.refresh(prospect)
-    
-    message_id = send_result.get('message_id', 'N/A')
-    logger.info(f"✅ [SEND] Email sent to {prospect.contact_email} (message_id: {message_id})")
-    logger.info(f"📝 [SEND] Updated prospect {prospect.id} - send_status=SENT, last_sent={prospect.last_sent}")
-    
-    return {
-        "success": True,
-        "message_id": message_id,
-        "sent_at": prospect.last_sent.isoformat() if prospect.last_sent else None
-    }
+        return 1
+    return prospect.sequence_index
+
+
+async def send_prospects_bulk(
+    prospects: Sequence[Prospect],
+    db: AsyncSession,
+    gmail_client: Optional[GmailClient] = None,
+    concurrency: int = 10
+) -> List[Union[Dict[str, Any], Exception]]:
+    """
+    Send emails for many prospects concurrently and persist all results in one transaction.
+
+    Gmail sends run concurrently (bounded by `concurrency`). Successful sends are
+    written with a single executemany UPDATE on prospects plus a single INSERT
+    for email_logs, followed by one commit.
+
+    Args:
+        prospects: Prospect model instances
+        db: Database session
+        gmail_client: Optional Gmail client (uses shared client if not provided)
+        concurrency: Max number of in-flight Gmail API calls
+
+    Returns:
+        List aligned with `prospects`. Each entry is either a dict with 'success',
+        'message_id' and 'sent_at', or the exception raised for that prospect
+        (ValueError if not sendable, Exception if Gmail send failed).
+
+    Raises:
+        ValueError: If Gmail client cannot be initialized
+    """
+    if not prospects:
+        return []
+
+    # Use shared Gmail client if not provided
+    if not gmail_client:
+        gmail_client = await _get_gmail_client()
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _send_one(prospect: Prospect) -> Tuple[Dict[str, Any], datetime]:
+        subject, body = _validate_sendable(prospect)
+        async with semaphore:
+            send_result = await _send_via_gmail(prospect, subject, body, gmail_client)
+        return send_result, datetime.now(timezone.utc)
+
+    outcomes = await asyncio.gather(*(_send_one(p) for p in prospects), return_exceptions=True)
+
+    results: List[Union[Dict[str, Any], Exception]] = []
+    update_rows: List[Dict[str, Any]] = []
+    log_rows: List[Dict[str, Any]] = []
+    sent: List[Tuple[Prospect, Dict[str, Any]]] = []
+    keep_raw_response = get_settings().debug
+
+    for prospect, outcome in zip(prospects, outcomes):
+        if isinstance(outcome, BaseException):
+            results.append(outcome)
+            continue
+
+        send_result, sent_at = outcome
+        # Move draft to final_body after sending (preserves sent email content)
+        row = {
+            "b_id": prospect.id,
+            "b_final_body": prospect.draft_body,
+            "b_last_sent": sent_at,
+            "b_sequence_index": _next_sequence_index(prospect),
+        }
+        update_rows.append(row)
+        log_rows.append({
+            "prospect_id": prospect.id,
+            "subject": prospect.draft_subject,
+            "body": prospect.draft_body,
+            "gmail_message_id": send_result.get("message_id"),
+            "gmail_thread_id": send_result.get("thread_id"),
+            # Full Gmail envelope is only kept for debugging - it bloats email_logs
+            "response": send_result if keep_raw_response else None,
+        })
+        sent.append((prospect, row))
+        results.append({
+            "success": True,
+            "message_id": send_result.get('message_id', 'N/A'),
+            "sent_at": sent_at.isoformat()
+        })
+
+    if update_rows:
+        # Update prospects: set final_body, clear draft, set sent_at, update status
+        prospects_table = Prospect.__table__
+        stmt = (
+            update(prospects_table)
+            .where(prospects_table.c.id == bindparam("b_id"))
+            .values(
+                final_body=bindparam("b_final_body"),
+                draft_body=None,
+                draft_subject=None,
+                last_sent=bindparam("b_last_sent"),
+                send_status=SendStatus.SENT.value,
+                outreach_status="sent",  # Legacy field
+                sequence_index=bindparam("b_sequence_index"),
+            )
+        )
+        await db.execute(stmt, update_rows)
+        await db.execute(insert(EmailLog), log_rows)
+        await db.commit()
+
+        # Sync in-memory prospects without marking them dirty (no second UPDATE on flush)
+        for prospect, row in sent:
+            set_committed_value(prospect, "final_body", row["b_final_body"])
+            set_committed_value(prospect, "draft_body", None)
+            set_committed_value(prospect, "draft_subject", None)
+            set_committed_value(prospect, "last_sent", row["b_last_sent"])
+            set_committed_value(prospect, "send_status", SendStatus.SENT.value)
+            set_committed_value(prospect, "outreach_status", "sent")
+            set_committed_value(prospect, "sequence_index", row["b_sequence_index"])
+            logger.info("📝 [SEND] Updated prospect %s - send_status=SENT, last_sent=%s", prospect.id, row['b_last_sent'])
+
+    logger.info("✅ [SEND] Bulk send complete: %s/%s sent", len(sent), len(prospects))
+    return results
+
+
+async def send_prospect_email(
+    prospect: Prospect,
+    db: AsyncSession,
+    gmail_client: Optional[GmailClient] = None
+) -> Dict[str, Any]:
+    """
+    Send email for a single prospect using Gmail API.
+
+    This is the canonical send logic used by both:
+    - Pipeline send (batch)
+    - Manual send (individual)
+
+    Thin wrapper over send_prospects_bulk() for a single prospect.
+
+    Args:
+        prospect: Prospect model instance
+        db: Database session
+        gmail_client: Optional Gmail client (uses shared client if not provided)
+
+    Returns:
+        Dict with 'success' (bool) and 'message_id' or 'error'
+
+    Raises:
+        ValueError: If prospect is not sendable
+        Exception: If Gmail send fails
+    """
+    # Validate before touching Gmail so an unsendable prospect never initializes the client
+    _validate_sendable(prospect)
+
+    result = (await send_prospects_bulk([prospect], db, gmail_client, concurrency=1))[0]
+    if isinstance(result, Exception):
+        raise result
 
+    logger.info("✅ [SEND] Email sent to %s (message_id: %s)", prospect.contact_email, result['message_id'])
+    return result
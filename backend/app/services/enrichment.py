@@ -7,17 +7,100 @@ Rules:
 - NO pattern generation, NO guessing, NO fallbacks
 - If no email found → return "no_email_found" status
 """
+import asyncio
 import logging
+import random
 import time
 import re
 import httpx
-from typing import Optional, Dict, Any, List, Set
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, Set, Tuple
+from cachetools import TTLCache
 from app.utils.domain import normalize_domain, validate_domain
 from app.utils.email_validation import is_plausible_email
 from app.services.exceptions import RateLimitError
 
+# Prefer google-re2 (in requirements.txt) for scanning untrusted HTML: linear-time
+# matching with no catastrophic backtracking. The stdlib fallback only covers
+# environments without its wheel; the bounded patterns below keep that safe too.
+try:
+    import re2 as _regex_engine
+except ImportError:
+    _regex_engine = re
+
 logger = logging.getLogger(__name__)
 
+# Snov.io domain_search results keyed by normalized domain (7 day TTL).
+# The same domain shows up across discovery runs and enrichment jobs - skip the API round-trip.
+_DOMAIN_SEARCH_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=604800)
+# Failed (non-success) responses are cached briefly so a burst of lookups for a
+# failing domain doesn't hammer the API, while transient failures still self-heal
+_DOMAIN_SEARCH_NEGATIVE_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+# Verification reads its own short-lived cache (1 hour) - a verify must not be
+# answered from week-old enrichment data
+_VERIFICATION_DOMAIN_SEARCH_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+_DOMAIN_SEARCH_LOCK = asyncio.Lock()
+
+# Minimum spacing between Snov.io calls across all concurrent enrichments
+# (replaces the old 1s sleep between sequentially enriched prospects)
+_SNOV_MIN_INTERVAL = 1.0
+_SNOV_THROTTLE_LOCK = asyncio.Lock()
+_snov_next_call_at = 0.0
+
+# Email extraction patterns - compiled once at import, not per scraped page.
+# Bounded quantifiers (RFC 5321 local part <= 64, DNS label <= 63, TLD <= 24) and
+# label-by-label domain matching keep backtracking linear on long runs of dots/dashes.
+_EMAIL_PATTERN = (
+    r'[a-zA-Z0-9._%+-]{1,64}@'
+    r'[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?'
+    r'(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*'
+    r'\.[a-zA-Z]{2,24}'
+)
+# Inline (?i) instead of re.IGNORECASE so the same pattern compiles under re2 and re
+_MAILTO_RE = _regex_engine.compile(rf'(?i)mailto:({_EMAIL_PATTERN})')
+_EMAIL_RE = _regex_engine.compile(rf'(?i)\b{_EMAIL_PATTERN}\b')
+
+# Common false positives in scraped HTML (placeholders, no-reply senders, site-builder/tracker addresses)
+_EMAIL_BLOCKLIST = ('example.com', 'test@', 'noreply', 'no-reply', 'donotreply', '@sentry', '@wix')
+# Single-pass scan for any blocklisted substring (emails are lowercased before matching)
+_EMAIL_BLOCKLIST_RE = re.compile("|".join(map(re.escape, _EMAIL_BLOCKLIST)))
+
+# Local parts of generic contact inboxes (ranked above other addresses)
+_COMMON_CONTACT_LOCAL_PARTS = frozenset({'info', 'contact', 'support', 'hello', 'hi', 'sales', 'help', 'admin', 'team'})
+
+# Upper bound on decoded HTML read per page - contact details live near the top or in
+# the footer of normal pages; giant pages are not worth downloading in full
+_SCRAPE_MAX_CHARS = 1024 * 1024
+_SCRAPE_CHUNK_SIZE = 16384
+_SCRAPE_CHUNK_OVERLAP = 320  # Carried between chunks so a mailto: link split at a boundary is still seen
+
+_SCRAPE_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Process-wide HTTP client for website scraping - keeps sockets warm across the
+# dozens of pages crawled per domain instead of a fresh TCP+TLS handshake per URL
+_SCRAPE_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_scrape_client() -> httpx.AsyncClient:
+    """Get (or lazily create) the shared scraping HTTP client"""
+    global _SCRAPE_CLIENT
+    if _SCRAPE_CLIENT is None or _SCRAPE_CLIENT.is_closed:
+        _SCRAPE_CLIENT = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+            headers={'User-Agent': _SCRAPE_USER_AGENT}
+        )
+    return _SCRAPE_CLIENT
+
+
+async def _close_scrape_client():
+    """Close the shared scraping HTTP client (called on application shutdown)"""
+    global _SCRAPE_CLIENT
+    if _SCRAPE_CLIENT is not None:
+        await _SCRAPE_CLIENT.aclose()
+        _SCRAPE_CLIENT = None
+
 
 def _extract_emails_from_html(html_content: str, domain: Optional[str] = None) -> list[tuple[str, int]]:
     """
@@ -37,115 +120,114 @@ def _extract_emails_from_html(html_content: str, domain: Optional[str] = None) -
     if not html_content:
         return []
     
-    emails_found: Set[str] = set()
-    emails_with_priority: List[tuple[str, int]] = []
+    # email -> priority; dict keeps first-seen order and doubles as the dedupe set
+    priorities: Dict[str, int] = {}
     
     # Extract domain for matching
     domain_lower = domain.lower() if domain else None
     
     # Method 1: Extract from mailto: links (highest priority)
-    mailto_pattern = r'mailto:([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
-    mailto_matches = re.finditer(mailto_pattern, html_content, re.IGNORECASE)
-    for match in mailto_matches:
+    for match in _MAILTO_RE.finditer(html_content):
         email = match.group(1).lower().strip()
-        if email not in emails_found and is_plausible_email(email):
-            emails_found.add(email)
+        if email not in priorities and is_plausible_email(email):
             # Check if email matches domain
             if domain_lower and domain_lower in email:
-                priority = 100  # mailto + domain match
+                priorities[email] = 100  # mailto + domain match
             else:
-                priority = 90  # mailto only
-            emails_with_priority.append((email, priority))
+                priorities[email] = 90  # mailto only
     
     # Method 2: Extract plain email addresses from text
     # More restrictive pattern to avoid false positives
-    email_pattern = r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b'
-    text_matches = re.finditer(email_pattern, html_content, re.IGNORECASE)
-    
-    common_contact_emails = ['info', 'contact', 'support', 'hello', 'hi', 'sales', 'help', 'admin', 'team']
-    
-    for match in text_matches:
+    for match in _EMAIL_RE.finditer(html_content):
         email = match.group(0).lower().strip()
-        if email in emails_found:
+        if email in priorities:
             continue
         
-        if not is_plausible_email(email):
+        # Skip common false positives (cheap substring scan before the full plausibility check)
+        if _EMAIL_BLOCKLIST_RE.search(email):
             continue
         
-        # Skip common false positives
-        if any(skip in email for skip in ['example.com', 'test@', 'noreply', 'no-reply', 'donotreply']):
+        if not is_plausible_email(email):
             continue
         
-        emails_found.add(email)
-        
         # Calculate priority
         local_part = email.split('@')[0]
         if domain_lower and domain_lower in email:
-            if local_part in common_contact_emails:
+            if local_part in _COMMON_CONTACT_LOCAL_PARTS:
                 priority = 80  # domain match + common contact
             else:
                 priority = 70  # domain match
-        elif local_part in common_contact_emails:
+        elif local_part in _COMMON_CONTACT_LOCAL_PARTS:
             priority = 60  # common contact
         else:
             priority = 50  # other valid email
         
-        emails_with_priority.append((email, priority))
-    
-    # Sort by priority (highest first)
-    emails_with_priority.sort(key=lambda x: x[1], reverse=True)
-    
-    # Filter out duplicates and invalid emails
-    filtered = []
-    seen = set()
-    for email, priority in emails_with_priority:
-        if email not in seen and is_plausible_email(email):
-            seen.add(email)
-            filtered.append((email, priority))
+        priorities[email] = priority
     
-    return filtered
+    # Sort by priority (highest first) - entries are already unique and plausible
+    return sorted(priorities.items(), key=lambda x: x[1], reverse=True)
 
 
 async def _scrape_email_from_url(url: str, domain: Optional[str] = None) -> Optional[str]:
     """
     Scrape email from a website URL using local HTML parsing.
     Returns the best email found (highest priority), or None.
+    
+    The body is streamed and capped at _SCRAPE_MAX_CHARS. Reading stops early once
+    a mailto: link on the prospect's own domain is seen - nothing can outrank it.
     """
     try:
-        async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-            response = await client.get(url, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            })
+        # Extract domain from URL if not provided
+        if not domain:
+            try:
+                from urllib.parse import urlparse
+                parsed = urlparse(url)
+                domain = parsed.netloc.replace('www.', '')
+            except:
+                pass
+        domain_lower = domain.lower() if domain else None
+        
+        parts: List[str] = []
+        chars_read = 0
+        tail = ""
+        async with _get_scrape_client().stream("GET", url) as response:
             response.raise_for_status()
-            html = response.text
-            
-            # Extract domain from URL if not provided
-            if not domain:
-                try:
-                    from urllib.parse import urlparse
-                    parsed = urlparse(url)
-                    domain = parsed.netloc.replace('www.', '')
-                except:
-                    pass
-            
-            emails_with_priority = _extract_emails_from_html(html, domain)
-            if emails_with_priority:
-                # Get the highest priority email
-                best_email, best_priority = emails_with_priority[0]
-                # Double-check plausibility before returning
-                if is_plausible_email(best_email):
-                    logger.info(f"✅ [SCRAPING] Found {len(emails_with_priority)} email(s) on {url}. Best: {best_email} (priority: {best_priority})")
-                    if len(emails_with_priority) > 1:
-                        logger.debug(f"   Other emails found: {[e[0] for e in emails_with_priority[1:3]]}")
-                    return best_email
-                else:
-                    logger.debug(f"🚫 [SCRAPING] Best email candidate failed plausibility check: {best_email}")
+            async for chunk in response.aiter_text(chunk_size=_SCRAPE_CHUNK_SIZE):
+                parts.append(chunk)
+                chars_read += len(chunk)
+                
+                if domain_lower:
+                    window = tail + chunk
+                    if any(
+                        domain_lower in m.group(1).lower() and is_plausible_email(m.group(1).lower())
+                        for m in _MAILTO_RE.finditer(window)
+                    ):
+                        break  # Top-priority email found - skip the rest of the page
+                    tail = window[-_SCRAPE_CHUNK_OVERLAP:]
+                
+                if chars_read >= _SCRAPE_MAX_CHARS:
+                    logger.debug("✂️  [SCRAPING] Truncated %s at %s chars", url, chars_read)
+                    break
+        html = "".join(parts)
+        
+        emails_with_priority = _extract_emails_from_html(html, domain)
+        if emails_with_priority:
+            # Get the highest priority email
+            best_email, best_priority = emails_with_priority[0]
+            # Double-check plausibility before returning
+            if is_plausible_email(best_email):
+                logger.info("✅ [SCRAPING] Found %s email(s) on %s. Best: %s (priority: %s)", len(emails_with_priority), url, best_email, best_priority)
+                if len(emails_with_priority) > 1:
+                    logger.debug("   Other emails found: %s", [e[0] for e in emails_with_priority[1:3]])
+                return best_email
             else:
-                logger.debug(f"⚠️  [SCRAPING] No valid emails found in HTML for {url}")
+                logger.debug("🚫 [SCRAPING] Best email candidate failed plausibility check: %s", best_email)
+        else:
+            logger.debug("⚠️  [SCRAPING] No valid emails found in HTML for %s", url)
     except httpx.HTTPStatusError as e:
-        logger.debug(f"HTTP error scraping {url}: {e.response.status_code}")
+        logger.debug("HTTP error scraping %s: %s", url, e.response.status_code)
     except Exception as e:
-        logger.debug(f"Local email scraping failed for {url}: {e}")
+        logger.debug("Local email scraping failed for %s: %s", url, e)
     
     return None
 
@@ -183,7 +265,7 @@ async def _scrape_emails_from_domain(domain: str, page_url: Optional[str] = None
         urls_to_try.append(f"https://{domain}{path}")
         urls_to_try.append(f"http://{domain}{path}")
     
-    logger.info(f"🔍 [SCRAPING] Will try {len(urls_to_try)} URLs for {domain}")
+    logger.info("🔍 [SCRAPING] Will try %s URLs for %s", len(urls_to_try), domain)
     
     # Try each URL until we find emails
     for url in urls_to_try:
@@ -194,11 +276,11 @@ async def _scrape_emails_from_domain(domain: str, page_url: Optional[str] = None
                 if url not in emails_by_page:
                     emails_by_page[url] = []
                 emails_by_page[url].append(email)
-                logger.info(f"✅ [SCRAPING] Found email {email} on {url}")
+                logger.info("✅ [SCRAPING] Found email %s on %s", email, url)
         except Exception as e:
-            logger.debug(f"Failed to scrape {url}: {e}")
+            logger.debug("Failed to scrape %s: %s", url, e)
     
-    logger.info(f"📊 [SCRAPING] Crawled {len(pages_crawled)} pages for {domain}, found emails on {len(emails_by_page)} pages")
+    logger.info("📊 [SCRAPING] Crawled %s pages for %s, found emails on %s pages", len(pages_crawled), domain, len(emails_by_page))
     return emails_by_page
 
 
@@ -235,6 +317,136 @@ def _is_snov_email_from_website(email_data: Dict[str, Any]) -> bool:
     return False
 
 
+async def _throttle_snov_call() -> None:
+    """
+    Wait for this caller's Snov.io slot, _SNOV_MIN_INTERVAL after the previous one.
+    
+    Slots are reserved under the lock; the sleep happens outside it.
+    """
+    global _snov_next_call_at
+    async with _SNOV_THROTTLE_LOCK:
+        now = time.monotonic()
+        slot = max(now, _snov_next_call_at)
+        _snov_next_call_at = slot + _SNOV_MIN_INTERVAL
+    if slot > now:
+        await asyncio.sleep(slot - now)
+
+
+async def _cached_domain_search(domain: str, success_cache: TTLCache = _DOMAIN_SEARCH_CACHE) -> Dict[str, Any]:
+    """
+    Snov.io domain_search with an in-process TTL cache.
+
+    Successful responses are read from success_cache (enrichment's 7 day cache by
+    default) and stored in it and the enrichment cache; failed responses are
+    cached for 5 minutes. Exceptions (e.g. RateLimitError) are never cached.
+    The lock guards the cache only - it is never held across the network call.
+    Cache misses are spaced by _throttle_snov_call().
+    """
+    key = normalize_domain(domain) or domain.strip().lower()
+    
+    async with _DOMAIN_SEARCH_LOCK:
+        cached = success_cache.get(key)
+        if cached is None:
+            cached = _DOMAIN_SEARCH_NEGATIVE_CACHE.get(key)
+    if cached is not None:
+        logger.debug("📦 [ENRICHMENT] Snov.io cache hit for %s", key)
+        return cached
+    
+    from app.clients.snov import SnovIOClient
+    snov_client = SnovIOClient()
+    await _throttle_snov_call()
+    result = await snov_client.domain_search(key)
+    
+    async with _DOMAIN_SEARCH_LOCK:
+        if result.get("success"):
+            _DOMAIN_SEARCH_CACHE[key] = result
+            success_cache[key] = result
+        else:
+            _DOMAIN_SEARCH_NEGATIVE_CACHE[key] = result
+    return result
+
+
+async def _verification_domain_search(domain: str) -> Dict[str, Any]:
+    """_cached_domain_search for verification - successful results are reused for 1 hour only"""
+    return await _cached_domain_search(domain, _VERIFICATION_DOMAIN_SEARCH_CACHE)
+
+
+async def _domain_search_with_backoff(domain: str, max_retries: int = 4) -> Dict[str, Any]:
+    """
+    _cached_domain_search that retries Snov.io rate limits in-process.
+    
+    Waits the provider's retry_after when it sends one, otherwise
+    min(30, 2**attempt) + jitter seconds; jitter keeps concurrent enrichments
+    from retrying in lockstep.
+    
+    Raises:
+        RateLimitError: If still rate limited after max_retries retries
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return await _cached_domain_search(domain)
+        except RateLimitError as e:
+            if attempt == max_retries:
+                raise
+            if e.retry_after:
+                delay = float(e.retry_after)
+            else:
+                delay = min(30, 2 ** attempt) + random.uniform(0, 1)
+            logger.warning("⏳ [ENRICHMENT] Snov.io rate limited for %s, retrying in %.1fs (attempt %s/%s)", domain, delay, attempt + 1, max_retries)
+            await asyncio.sleep(delay)
+
+
+# Stored snov_payload keeps at most this many emails (readers only look at the first)
+_PAYLOAD_MAX_EMAILS = 10
+
+
+def _compact_enrichment_payload(enrich_result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce an enrichment result to the fields read back from snov_payload.
+    
+    Drops emails_by_page (duplicates emails per crawled URL) and the domain
+    (already a prospect column), caps emails and stamps fetched_at.
+    """
+    payload = {
+        key: value for key, value in enrich_result.items()
+        if key not in ("emails_by_page", "domain")
+    }
+    if payload.get("emails"):
+        payload["emails"] = payload["emails"][:_PAYLOAD_MAX_EMAILS]
+    payload["fetched_at"] = int(time.time())
+    return payload
+
+
+def _enrichment_payload_columns(enrich_result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Prospect column values for persisting an enrichment result.
+    
+    Every enrichment writer goes through here so snov_payload_updated_at
+    (read by the batch freshness filter) is always stamped with the payload.
+    """
+    return {
+        "snov_payload": _compact_enrichment_payload(enrich_result),
+        "snov_payload_updated_at": datetime.now(timezone.utc),
+    }
+
+
+def _no_email_result(domain: str, error: Optional[str]) -> Dict[str, Any]:
+    """Canonical enrichment result for a domain where no email could be found"""
+    return {
+        "emails": [],
+        "primary_email": None,
+        "email_status": "no_email_found",
+        "pages_crawled": [],
+        "emails_by_page": {},
+        "snov_emails_accepted": 0,
+        "snov_emails_rejected": 0,
+        "domain": domain,
+        "success": False,
+        "source": "no_email_found",
+        "error": error,
+    }
+
+
 async def enrich_prospect_email(domain: str, name: Optional[str] = None, page_url: Optional[str] = None) -> Dict[str, Any]:
     """
     STRICT MODE enrichment: Only saves emails found explicitly on websites.
@@ -267,23 +479,10 @@ async def enrich_prospect_email(domain: str, name: Optional[str] = None, page_ur
     normalized_domain = normalize_domain(domain)
     if not normalized_domain:
         error_msg = f"Invalid domain format: {domain}"
-        logger.error(f"❌ [ENRICHMENT] {error_msg}")
-        return {
-            "emails": [],
-            "primary_email": None,
-            "email_status": "no_email_found",
-            "pages_crawled": [],
-            "emails_by_page": {},
-            "snov_emails_accepted": 0,
-            "snov_emails_rejected": 0,
-            "domain": domain,
-            "success": False,
-            "source": "no_email_found",
-            "error": error_msg,
-        }
-    
-    logger.info(f"🔍 [ENRICHMENT] STRICT MODE: Starting enrichment for {normalized_domain}")
-    logger.info(f"📥 [ENRICHMENT] Input - domain: {domain} → normalized: {normalized_domain}, page_url: {page_url or 'N/A'}")
+        logger.error("❌ [ENRICHMENT] %s", error_msg)
+        return _no_email_result(domain, error_msg)
+    
+    logger.info("🔍 [ENRICHMENT] STRICT MODE: Starting enrichment for %s (input: %s, page_url: %s)", normalized_domain, domain, page_url or 'N/A')
     
     all_emails: Set[str] = set()
     pages_crawled: List[str] = []
@@ -292,7 +491,7 @@ async def enrich_prospect_email(domain: str, name: Optional[str] = None, page_ur
     snov_emails_rejected = 0
     
     # STEP 1: Scrape website pages for emails
-    logger.info(f"📄 [ENRICHMENT] Step 1: Scraping website pages for {normalized_domain}...")
+    logger.info("📄 [ENRICHMENT] Step 1: Scraping website pages for %s...", normalized_domain)
     try:
         emails_by_page = await _scrape_emails_from_domain(normalized_domain, page_url)
         pages_crawled = list(emails_by_page.keys())
@@ -302,23 +501,21 @@ async def enrich_prospect_email(domain: str, name: Optional[str] = None, page_ur
             for email in emails:
                 if is_plausible_email(email):
                     all_emails.add(email)
-                    logger.info(f"✅ [ENRICHMENT] Email found on {url}: {email}")
+                    logger.info("✅ [ENRICHMENT] Email found on %s: %s", url, email)
         
-        logger.info(f"📊 [ENRICHMENT] Step 1 complete: Crawled {len(pages_crawled)} pages, found {len(all_emails)} unique email(s)")
+        logger.info("📊 [ENRICHMENT] Step 1 complete: Crawled %s pages, found %s unique email(s)", len(pages_crawled), len(all_emails))
         
     except Exception as scrape_err:
-        logger.error(f"❌ [ENRICHMENT] HTML scraping failed for {normalized_domain}: {scrape_err}", exc_info=True)
+        logger.error("❌ [ENRICHMENT] HTML scraping failed for %s: %s", normalized_domain, scrape_err, exc_info=True)
     
     # STEP 2: Optionally check Snov.io, but ONLY accept website-source emails
-    logger.info(f"📞 [ENRICHMENT] Step 2: Checking Snov.io for website-source emails (STRICT MODE)...")
+    logger.info("📞 [ENRICHMENT] Step 2: Checking Snov.io for website-source emails (STRICT MODE)...")
     try:
-        from app.clients.snov import SnovIOClient
-        snov_client = SnovIOClient()
-        snov_result = await snov_client.domain_search(normalized_domain)
+        snov_result = await _domain_search_with_backoff(normalized_domain)
         
         if snov_result.get("success") and snov_result.get("emails"):
             snov_emails = snov_result.get("emails", [])
-            logger.info(f"📧 [ENRICHMENT] Snov.io returned {len(snov_emails)} email(s) for {normalized_domain}")
+            logger.info("📧 [ENRICHMENT] Snov.io returned %s email(s) for %s", len(snov_emails), normalized_domain)
             
             for email_data in snov_emails:
                 if not isinstance(email_data, dict):
@@ -333,17 +530,17 @@ async def enrich_prospect_email(domain: str, name: Optional[str] = None, page_ur
                     if email_value not in all_emails:
                         all_emails.add(email_value)
                         snov_emails_accepted += 1
-                        logger.info(f"✅ [ENRICHMENT] Accepted Snov.io email (website source): {email_value}")
+                        logger.info("✅ [ENRICHMENT] Accepted Snov.io email (website source): %s", email_value)
                     else:
-                        logger.debug(f"ℹ️  [ENRICHMENT] Snov.io email already found via scraping: {email_value}")
+                        logger.debug("ℹ️  [ENRICHMENT] Snov.io email already found via scraping: %s", email_value)
                 else:
                     snov_emails_rejected += 1
-                    logger.warning(f"🚫 [ENRICHMENT] Rejected Snov.io email (no website source): {email_value}")
+                    logger.warning("🚫 [ENRICHMENT] Rejected Snov.io email (no website source): %s", email_value)
         else:
-            logger.info(f"ℹ️  [ENRICHMENT] Snov.io returned no emails or failed for {normalized_domain}")
+            logger.info("ℹ️  [ENRICHMENT] Snov.io returned no emails or failed for %s", normalized_domain)
             
     except Exception as snov_err:
-        logger.warning(f"⚠️  [ENRICHMENT] Snov.io check failed for {normalized_domain}: {snov_err}")
+        logger.warning("⚠️  [ENRICHMENT] Snov.io check failed for %s: %s", normalized_domain, snov_err)
         # Continue - Snov.io is optional
     
     # STEP 3: Deduplicate and validate
@@ -356,16 +553,18 @@ async def enrich_prospect_email(domain: str, name: Optional[str] = None, page_ur
     if unique_emails:
         email_status = "found"
         source = "html_scraping" if snov_emails_accepted == 0 else "html_scraping+snov_website"
-        logger.info(f"✅ [ENRICHMENT] SUCCESS: Found {len(unique_emails)} email(s) for {normalized_domain} in {total_time:.0f}ms")
-        logger.info(f"📧 [ENRICHMENT] Emails: {', '.join(unique_emails)}")
-        logger.info(f"📄 [ENRICHMENT] Pages crawled: {len(pages_crawled)}")
-        logger.info(f"✅ [ENRICHMENT] Snov.io: {snov_emails_accepted} accepted, {snov_emails_rejected} rejected")
+        logger.info(
+            "✅ [ENRICHMENT] SUCCESS: Found %s email(s) for %s in %.0fms: %s (pages crawled: %s, Snov.io: %s accepted, %s rejected)",
+            len(unique_emails), normalized_domain, total_time, unique_emails,
+            len(pages_crawled), snov_emails_accepted, snov_emails_rejected
+        )
     else:
         email_status = "no_email_found"
         source = "no_email_found"
-        logger.warning(f"⚠️  [ENRICHMENT] NO EMAIL FOUND for {normalized_domain} after {total_time:.0f}ms")
-        logger.info(f"📄 [ENRICHMENT] Pages crawled: {len(pages_crawled)}")
-        logger.info(f"🚫 [ENRICHMENT] Snov.io: {snov_emails_accepted} accepted, {snov_emails_rejected} rejected")
+        logger.warning(
+            "⚠️  [ENRICHMENT] NO EMAIL FOUND for %s after %.0fms (pages crawled: %s, Snov.io: %s accepted, %s rejected)",
+            normalized_domain, total_time, len(pages_crawled), snov_emails_accepted, snov_emails_rejected
+        )
     
     return {
         "emails": unique_emails,
@@ -380,3 +579,42 @@ async def enrich_prospect_email(domain: str, name: Optional[str] = None, page_ur
         "source": source,
         "error": None,
     }
+
+
+async def enrich_prospects_bulk(
+    items: List[Tuple[str, Optional[str]]],
+    concurrency: int = 20
+) -> List[Dict[str, Any]]:
+    """
+    Enrich many domains concurrently.
+    
+    Args:
+        items: List of (domain, page_url) tuples
+        concurrency: Max number of domains enriched at once
+    
+    Returns:
+        List of enrich_prospect_email() results, aligned with `items`.
+        A domain that raised is reported as a no_email_found result with
+        source "error" and `error` set (an invalid domain keeps source "no_email_found").
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def _enrich(domain: str, page_url: Optional[str]) -> Dict[str, Any]:
+        # Stagger start times so the first wave doesn't hit providers as one burst
+        await asyncio.sleep(random.uniform(0, 0.5))
+        async with semaphore:
+            return await enrich_prospect_email(domain, None, page_url)
+    
+    results = await asyncio.gather(
+        *(_enrich(domain, page_url) for domain, page_url in items),
+        return_exceptions=True
+    )
+    
+    aligned: List[Dict[str, Any]] = []
+    for (domain, _), result in zip(items, results):
+        if isinstance(result, BaseException):
+            logger.error("❌ [ENRICHMENT] Bulk enrichment failed for %s: %s", domain, result)
+            aligned.append({**_no_email_result(domain, str(result)), "source": "error"})
+        else:
+            aligned.append(result)
+    return aligned
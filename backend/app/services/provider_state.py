@@ -2,25 +2,53 @@
 Provider state management for tracking rate limits and restrictions.
 Uses Redis if available, falls back to in-memory storage.
 """
-import os
 import logging
 import time
+import importlib.util
 from typing import Optional, Dict
 from datetime import datetime, timezone
+from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
-# Try to import Redis
-try:
-    import redis
-    REDIS_AVAILABLE = True
-except ImportError:
-    REDIS_AVAILABLE = False
+# Check for Redis without importing it - the client library is only loaded
+# on first use, so processes that never set REDIS_URL don't pay for it
+REDIS_AVAILABLE = importlib.util.find_spec("redis") is not None
+if not REDIS_AVAILABLE:
     logger.warning("Redis not available, using in-memory provider state")
 
 # In-memory fallback storage
 _memory_state: Dict[str, float] = {}  # provider_name -> unix timestamp when restriction expires
 
+# Process-wide Redis client backed by a bounded connection pool
+_redis_conn = None
+
+
+def get_redis_connection(redis_url: str):
+    """
+    Get (or lazily create) the shared Redis client.
+
+    Uses a BlockingConnectionPool so concurrent callers get their own sockets
+    (waiting briefly when the pool is exhausted), with TCP keepalive and
+    periodic health checks so a half-open connection is detected instead of
+    hanging until socket_timeout.
+    """
+    global _redis_conn
+    if _redis_conn is None:
+        import redis
+        pool = redis.BlockingConnectionPool.from_url(
+            redis_url,
+            max_connections=32,
+            timeout=2,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+            socket_keepalive=True,
+            health_check_interval=30,
+            decode_responses=True
+        )
+        _redis_conn = redis.Redis(connection_pool=pool)
+    return _redis_conn
+
 
 class ProviderState:
     """
@@ -32,15 +60,10 @@ class ProviderState:
         self.use_redis = False
         
         if REDIS_AVAILABLE:
-            redis_url = os.getenv("REDIS_URL")
+            redis_url = get_settings().redis_url
             if redis_url:
                 try:
-                    self.redis_client = redis.from_url(
-                        redis_url,
-                        socket_connect_timeout=2,
-                        socket_timeout=2,
-                        decode_responses=True
-                    )
+                    self.redis_client = get_redis_connection(redis_url)
                     # Test connection
                     self.redis_client.ping()
                     self.use_redis = True
@@ -526,11 +526,12 @@ async def discover_websites_async(job_id: str) -> Dict[str, Any]:
                             # MANDATORY: Enrich email before saving prospect (only if partner-qualified)
                             # Discovery MUST NOT save prospects without emails
                             # DEFENSIVE: Enrichment failures should NOT break the entire discovery pipeline
-                            from app.services.enrichment import enrich_prospect_email
+                            from app.services.enrichment import enrich_prospect_email, _enrichment_payload_columns
                             
                             enrich_result = None
                             contact_email = None
                             snov_payload = None
+                            snov_payload_updated_at = None
                             
                             # Only enrich if intent qualifies as business partner
                             if should_enrich:
@@ -546,12 +547,16 @@ async def discover_websites_async(job_id: str) -> Dict[str, Any]:
                                         if email_status == "found":
                                             # Email found on website
                                             contact_email = enrich_result.get("primary_email")
-                                            snov_payload = enrich_result  # Store full result
+                                            payload_columns = _enrichment_payload_columns(enrich_result)
+                                            snov_payload = payload_columns["snov_payload"]
+                                            snov_payload_updated_at = payload_columns["snov_payload_updated_at"]
                                             logger.info(f"✅ [DISCOVERY] Enriched {domain}: {contact_email} (pages crawled: {len(enrich_result.get('pages_crawled', []))})")
                                         else:
                                             # No email found on website
                                             contact_email = None
-                                            snov_payload = enrich_result  # Store full result with "no_email_found" status
+                                            payload_columns = _enrichment_payload_columns(enrich_result)  # Keeps the "no_email_found" status
+                                            snov_payload = payload_columns["snov_payload"]
+                                            snov_payload_updated_at = payload_columns["snov_payload_updated_at"]
                                             logger.warning(f"⚠️  [DISCOVERY] No email found on website for {domain} (pages crawled: {len(enrich_result.get('pages_crawled', []))})")
                                     else:
                                         # Enrichment service returned None (should not happen)
@@ -605,6 +610,7 @@ async def discover_websites_async(job_id: str) -> Dict[str, Any]:
                                 outreach_status="pending",
                                 discovery_query_id=discovery_query.id,
                                 snov_payload=snov_payload,
+                                snov_payload_updated_at=snov_payload_updated_at,
                                 serp_intent=serp_intent,
                                 serp_confidence=serp_confidence,
                                 serp_signals=serp_signals,
@@ -2,22 +2,85 @@
 Enrichment task - finds emails for prospects using Snov.io
 Runs directly in backend (no external worker needed for free tier)
 """
-import asyncio
 import logging
+import time
 from typing import Dict, Any, List, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, or_, bindparam, lambda_stmt
 from app.db.database import AsyncSessionLocal
 from app.models.prospect import Prospect
 from app.models.job import Job
 from app.clients.snov import SnovIOClient
 from app.utils.email_validation import is_plausible_email, format_job_error
 from app.services.exceptions import RateLimitError
-from datetime import datetime, timezone
+from app.services.enrichment import enrich_prospects_bulk, _enrichment_payload_columns
+from datetime import datetime, timezone, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Max prospects enriched at once - each enrichment crawls pages and calls Snov.io
+ENRICHMENT_CONCURRENCY = 5
+
+# Prospects enriched within this window are skipped by batch runs - their
+# payload already holds the answer a new crawl + Snov.io lookup would return
+ENRICHMENT_REFRESH_DAYS = 7
+
+# Cached statements - SQLAlchemy's lambda cache skips the Core -> SQL compile on reuse
+_GET_JOB = lambda_stmt(lambda: select(Job).where(Job.id == bindparam("job_id")))
+
+# Eligible prospects: pending outreach with service/brand intent (partner-qualified).
+# NULL serp_intent covers legacy prospects created before intent filtering was added.
+# Only the columns enrichment reads - skip large JSON payloads from prior runs.
+# Writes go through _bulk_update_prospects(), so no ORM objects are needed.
+_ENRICHABLE_PROSPECTS = lambda_stmt(lambda: select(
+    Prospect.id,
+    Prospect.domain,
+    Prospect.page_url,
+    Prospect.contact_email
+).where(
+    Prospect.outreach_status == "pending",
+    or_(
+        Prospect.serp_intent.in_(["service", "brand"]),
+        Prospect.serp_intent.is_(None)
+    )
+))
+
+
+def _prospect_update(
+    prospect_id: UUID,
+    contact_email: Optional[str],
+    contact_method: str,
+    snov_payload: Dict[str, Any],
+    scrape_status: Optional[str] = None,
+    fresh: bool = True
+) -> Dict[str, Any]:
+    """Build one row for _bulk_update_prospects() (fresh=False keeps the prospect due for the next batch run)"""
+    row = {
+        "id": prospect_id,
+        "contact_email": contact_email,
+        "contact_method": contact_method,
+        **_enrichment_payload_columns(snov_payload),
+    }
+    if not fresh:
+        row["snov_payload_updated_at"] = None
+    if scrape_status:
+        row["scrape_status"] = scrape_status
+    return row
+
+
+async def _bulk_update_prospects(db: AsyncSession, updates: List[Dict[str, Any]]) -> None:
+    """
+    Persist enrichment results with ORM bulk UPDATE by primary key (executemany).
+    
+    Rows are grouped by key set so each group is a single executemany batch.
+    """
+    groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+    for row in updates:
+        groups.setdefault(frozenset(row), []).append(row)
+    for rows in groups.values():
+        await db.execute(update(Prospect), rows)
+
 
 async def process_enrichment_job(job_id: str) -> Dict[str, Any]:
     """
@@ -25,28 +88,29 @@ async def process_enrichment_job(job_id: str) -> Dict[str, Any]:
 
     Behaviour:
     - Never skips a prospect just because it already has an email.
+    - Batch runs (no prospect_ids) skip prospects enriched in the last ENRICHMENT_REFRESH_DAYS.
     - Always compares new vs existing email confidence and updates when better.
     - Uses a very low‑confidence guesser fallback when the provider returns no emails.
     """
     # CANARY LOG - If you see this, the task started successfully
-    logger.info(f"🚀 Enrichment job started: {job_id}")
+    logger.info("🚀 Enrichment job started: %s", job_id)
+    _now = time.time
     
     async with AsyncSessionLocal() as db:
         try:
             # Get job
-            from sqlalchemy import select
-            result = await db.execute(select(Job).where(Job.id == job_id))
+            result = await db.execute(_GET_JOB, {"job_id": job_id})
             job = result.scalar_one_or_none()
             
             if not job:
-                logger.error(f"❌ Enrichment job {job_id} not found")
+                logger.error("❌ Enrichment job %s not found", job_id)
                 return {"error": "Job not found"}
             
             job.status = "running"
             await db.commit()
             await db.refresh(job)
             
-            logger.info(f"🔍 Starting enrichment job {job_id}...")
+            logger.info("🔍 Starting enrichment job %s...", job_id)
             
             # Get job parameters
             params = job.params or {}
@@ -55,53 +119,51 @@ async def process_enrichment_job(job_id: str) -> Dict[str, Any]:
             only_missing_emails = params.get("only_missing_emails", False)
             
             # Build query for prospects that are eligible for enrichment.
-            # GATE: Only enrich prospects with service or brand intent (partner-qualified)
             # PRIORITIZE prospects without emails, but also process ones with emails to improve them.
             # Order by: NULL emails first (highest priority), then by created_at (oldest first)
-            from sqlalchemy import or_, nullslast
-            
-            from sqlalchemy import or_
-            query = select(Prospect).where(
-                Prospect.outreach_status == "pending",
-                # Only enrich service/brand intent (partner-qualified domains)
-                # Also include prospects with NULL serp_intent (created before intent filtering was added)
-                or_(
-                    Prospect.serp_intent.in_(["service", "brand"]),
-                    Prospect.serp_intent.is_(None)  # Include legacy prospects without intent classification
-                )
-            )
+            # Closure variables in the lambdas below are bound as parameters, not cache keys.
+            query = _ENRICHABLE_PROSPECTS
             
             # If only_missing_emails is True, filter to only prospects without emails
             if only_missing_emails:
-                query = query.where(Prospect.contact_email.is_(None))
-                logger.info(f"🔍 Filtering to only prospects without emails (only_missing_emails=True)")
+                query += lambda s: s.where(Prospect.contact_email.is_(None))
+                logger.info("🔍 Filtering to only prospects without emails (only_missing_emails=True)")
             
-            logger.info(f"🔍 Filtering to only partner-qualified prospects (intent: service or brand)")
+            logger.info("🔍 Filtering to only partner-qualified prospects (intent: service or brand)")
             
             if prospect_ids:
-                query = query.where(Prospect.id.in_([UUID(pid) for pid in prospect_ids]))
+                prospect_uuids = [UUID(pid) for pid in prospect_ids]
+                query += lambda s: s.where(Prospect.id.in_(prospect_uuids))
             else:
+                # Skip prospects with a fresh payload from a previous run
+                stale_before = datetime.now(timezone.utc) - timedelta(days=ENRICHMENT_REFRESH_DAYS)
+                query += lambda s: s.where(or_(
+                    Prospect.snov_payload_updated_at.is_(None),
+                    Prospect.snov_payload_updated_at < stale_before
+                ))
                 # If no specific IDs, prioritize prospects without emails
                 # This ensures we enrich the ones that were skipped during discovery
-                query = query.order_by(
+                query += lambda s: s.order_by(
                     Prospect.contact_email.is_(None).desc(),  # NULL emails first
                     Prospect.created_at.asc()  # Oldest first
                 )
             
-            query = query.limit(max_prospects)
+            query += lambda s: s.limit(max_prospects)
             
             result = await db.execute(query)
-            prospects = result.scalars().all()
+            prospects = result.all()
+            total = len(prospects)
             
             # Count how many don't have emails
             no_email_count_query = sum(1 for p in prospects if not p.contact_email)
-            has_email_count = len(prospects) - no_email_count_query
+            has_email_count = total - no_email_count_query
             
-            logger.info(f"🔍 Found {len(prospects)} prospects to enrich:")
-            logger.info(f"   📧 {no_email_count_query} without emails (priority)")
-            logger.info(f"   ✉️  {has_email_count} with existing emails (will improve if better match found)")
+            logger.info(
+                "🔍 Found %s prospects to enrich: 📧 %s without emails (priority), ✉️  %s with existing emails (will improve if better match found)",
+                total, no_email_count_query, has_email_count
+            )
             
-            if len(prospects) == 0:
+            if total == 0:
                 job.status = "completed"
                 job.result = {
                     "prospects_enriched": 0,
@@ -124,167 +186,113 @@ async def process_enrichment_job(job_id: str) -> Dict[str, Any]:
                 job.status = "failed"
                 job.error_message = f"Snov.io not configured: {e}"
                 await db.commit()
-                logger.error(f"❌ Snov.io client initialization failed: {e}")
+                logger.error("❌ Snov.io client initialization failed: %s", e)
                 return {"error": str(e)}
             
             enriched_count = 0
             failed_count = 0
             no_email_count = 0
             
-            # Enrich each prospect with comprehensive logging
-            import time
-            enrichment_start_time = time.time()
+            # Enrich all prospects concurrently (network-bound), then apply results
+            # sequentially - the AsyncSession must not be shared across tasks
+            enrichment_start_time = _now()
             
-            for idx, prospect in enumerate(prospects, 1):
-                prospect_start_time = time.time()
+            logger.info("🔍 [ENRICHMENT] Enriching %s prospects (concurrency: %s)", total, ENRICHMENT_CONCURRENCY)
+            enrich_results = await enrich_prospects_bulk(
+                [(prospect.domain, prospect.page_url) for prospect in prospects],
+                concurrency=ENRICHMENT_CONCURRENCY
+            )
+            
+            network_time = (_now() - enrichment_start_time) * 1000
+            logger.info("⏱️  [ENRICHMENT] Enrichment lookups completed in %.0fms", network_time)
+            
+            updates: List[Dict[str, Any]] = []
+            for idx, (prospect, enrich_result) in enumerate(zip(prospects, enrich_results), 1):
                 try:
                     domain = prospect.domain
-                    prospect_id = str(prospect.id)
                     
-                    logger.info(f"🔍 [ENRICHMENT] [{idx}/{len(prospects)}] Starting enrichment for {domain} (id: {prospect_id})")
-                    logger.info(f"📥 [ENRICHMENT] Input - domain: {domain}, prospect_id: {prospect_id}")
-                    
-                    # Call STRICT MODE enrichment service
-                    try:
-                        from app.services.enrichment import enrich_prospect_email
-                        enrich_result = await enrich_prospect_email(domain, None, prospect.page_url)
-                        
-                        # STRICT MODE: Handle new response format
-                        if not enrich_result:
-                            logger.error(f"❌ [ENRICHMENT] Enrichment service returned None for {domain}")
-                            enrich_result = {
-                                "emails": [],
-                                "primary_email": None,
-                                "email_status": "no_email_found",
-                                "pages_crawled": [],
-                                "emails_by_page": {},
-                                "snov_emails_accepted": 0,
-                                "snov_emails_rejected": 0,
-                                "success": False,
-                                "source": "no_email_found",
-                            }
-                        
-                        # Log enrichment results
-                        email_status = enrich_result.get("email_status", "no_email_found")
-                        emails_found = enrich_result.get("emails", [])
-                        pages_crawled = enrich_result.get("pages_crawled", [])
-                        snov_accepted = enrich_result.get("snov_emails_accepted", 0)
-                        snov_rejected = enrich_result.get("snov_emails_rejected", 0)
-                        
-                        logger.info(f"📊 [ENRICHMENT] [{idx}/{len(prospects)}] Enrichment result for {domain}:")
-                        logger.info(f"   Status: {email_status}")
-                        logger.info(f"   Emails found: {len(emails_found)}")
-                        logger.info(f"   Pages crawled: {len(pages_crawled)}")
-                        logger.info(f"   Snov.io: {snov_accepted} accepted, {snov_rejected} rejected")
-                        
-                        if email_status == "no_email_found":
-                            logger.warning(f"⚠️  [ENRICHMENT] [{idx}/{len(prospects)}] NO EMAIL FOUND on website for {domain}")
-                            # Store "no_email_found" status
-                            prospect.contact_email = None
-                            prospect.contact_method = "no_email_found"
-                            prospect.snov_payload = {
-                                "email_status": "no_email_found",
-                                "pages_crawled": pages_crawled,
-                                "emails_by_page": enrich_result.get("emails_by_page", {}),
-                                "snov_emails_accepted": snov_accepted,
-                                "snov_emails_rejected": snov_rejected,
-                                "source": enrich_result.get("source", "no_email_found"),
-                            }
-                            no_email_count += 1
-                            await db.commit()
-                            await db.refresh(prospect)
-                            continue
-                        
-                        # Convert to legacy format for compatibility
-                        primary_email = enrich_result.get("primary_email")
-                        if primary_email:
-                            snov_result = {
-                                "success": True,
-                                "emails": [{
-                                    "value": email,
-                                    "confidence_score": 50.0,  # Default confidence for website-found emails
-                                } for email in emails_found],
-                            }
-                        else:
-                            snov_result = {"success": False, "emails": []}
-                        
-                        snov_time = (time.time() - prospect_start_time) * 1000
-                        logger.info(f"⏱️  [ENRICHMENT] Enrichment completed in {snov_time:.0f}ms")
-                        
-                    except Exception as enrich_err:
-                        snov_time = (time.time() - prospect_start_time) * 1000
-                        logger.error(f"❌ [ENRICHMENT] Enrichment failed after {snov_time:.0f}ms: {enrich_err}", exc_info=True)
-                        # On error, mark as no_email_found
-                        prospect.contact_email = None
-                        prospect.contact_method = "no_email_found"
-                        prospect.snov_payload = {
+                    if enrich_result.get("source") == "error":
+                        # Enrichment raised - store the error and count it as failed
+                        logger.error("❌ [ENRICHMENT] Enrichment failed for %s: %s", domain, enrich_result['error'])
+                        updates.append(_prospect_update(prospect.id, None, "no_email_found", {
                             "email_status": "no_email_found",
-                            "error": str(enrich_err),
+                            "error": enrich_result["error"],
                             "source": "error",
-                        }
+                        }, fresh=False))
+                        failed_count += 1
+                        continue
+                    
+                    # Log enrichment results
+                    email_status = enrich_result.get("email_status", "no_email_found")
+                    emails_found = enrich_result.get("emails", [])
+                    pages_crawled = enrich_result.get("pages_crawled", [])
+                    snov_accepted = enrich_result.get("snov_emails_accepted", 0)
+                    snov_rejected = enrich_result.get("snov_emails_rejected", 0)
+                    
+                    logger.debug(
+                        "📊 [ENRICHMENT] [%s/%s] %s (id: %s): status=%s, emails=%s, pages_crawled=%s, snov=%s accepted/%s rejected",
+                        idx, total, domain, prospect.id, email_status, len(emails_found),
+                        len(pages_crawled), snov_accepted, snov_rejected
+                    )
+                    
+                    if email_status == "no_email_found":
+                        logger.info("⚠️  [ENRICHMENT] [%s/%s] NO EMAIL FOUND on website for %s", idx, total, domain)
+                        # Store "no_email_found" status
+                        updates.append(_prospect_update(prospect.id, None, "no_email_found", {
+                            "email_status": "no_email_found",
+                            "pages_crawled": pages_crawled,
+                            "snov_emails_accepted": snov_accepted,
+                            "snov_emails_rejected": snov_rejected,
+                            "source": enrich_result.get("source", "no_email_found"),
+                        }))
                         no_email_count += 1
-                        await db.commit()
-                        await db.refresh(prospect)
                         continue
                     
                     # STRICT MODE: Use primary_email from enrichment result
                     new_email = enrich_result.get("primary_email")
-                    new_confidence = 50.0  # Default confidence for website-found emails
                     provider_source = enrich_result.get("source", "html_scraping")
 
                     # STRICT MODE: Save email if found, otherwise already handled above
                     if new_email:
                         # Final validation before saving
                         if not is_plausible_email(new_email):
-                            logger.warning(f"🚫 [ENRICHMENT] Rejecting implausible email before save: {new_email}")
-                            prospect.contact_email = None
-                            prospect.contact_method = "no_email_found"
-                            prospect.snov_payload = enrich_result
+                            logger.warning("🚫 [ENRICHMENT] Rejecting implausible email before save: %s", new_email)
+                            updates.append(_prospect_update(prospect.id, None, "no_email_found", enrich_result))
                             no_email_count += 1
-                            await db.commit()
-                            await db.refresh(prospect)
                             continue
                         
                         # Save the email
                         old_email_log = str(prospect.contact_email) if prospect.contact_email else None
                         logger.info(
-                            f"✅ [ENRICHMENT] [{idx}/{len(prospects)}] Saving email for {domain}: "
-                            f"{old_email_log or 'None'} -> {new_email}, source={provider_source}, "
-                            f"pages_crawled={len(enrich_result.get('pages_crawled', []))}, "
-                            f"total_emails={len(enrich_result.get('emails', []))}"
+                            "✅ [ENRICHMENT] [%s/%s] Saving email for %s: %s -> %s, source=%s, pages_crawled=%s, total_emails=%s",
+                            idx, total, domain, old_email_log or 'None', new_email, provider_source,
+                            len(pages_crawled), len(emails_found)
                         )
-                        prospect.contact_email = new_email
-                        prospect.contact_method = provider_source
-                        # Store full enrichment result in snov_payload
-                        prospect.snov_payload = enrich_result
-                        # Update scrape_status to ENRICHED when email is successfully found
-                        prospect.scrape_status = "ENRICHED"
+                        # Store the enrichment result in snov_payload (compacted by _prospect_update)
+                        # and set scrape_status to ENRICHED when email is successfully found
+                        updates.append(_prospect_update(
+                            prospect.id, new_email, provider_source, enrich_result, scrape_status="ENRICHED"
+                        ))
                         enriched_count += 1
                     else:
                         # This should not happen (handled above), but log it
-                        logger.error(
-                            f"❌ [ENRICHMENT] [{idx}/{len(prospects)}] Unexpected: new_email is None but email_status is 'found' for {domain}"
-                        )
-                        prospect.contact_email = None
-                        prospect.contact_method = "no_email_found"
-                        prospect.snov_payload = enrich_result
+                        logger.error("❌ [ENRICHMENT] [%s/%s] Unexpected: new_email is None but email_status is 'found' for %s", idx, total, domain)
+                        updates.append(_prospect_update(prospect.id, None, "no_email_found", enrich_result))
                         no_email_count += 1
                     
-                    await db.commit()
-                    await db.refresh(prospect)
-                    
-                    # Rate limiting (1 request per second to respect rate limits)
-                    await asyncio.sleep(1)
-                    
                 except Exception as e:
-                    total_time = (time.time() - prospect_start_time) * 1000
-                    logger.error(f"❌ [ENRICHMENT] [{idx}/{len(prospects)}] Error enriching {prospect.domain} after {total_time:.0f}ms: {e}", exc_info=True)
-                    logger.error(f"📤 [ENRICHMENT] Output - error: {str(e)}, stack_trace: {type(e).__name__}")
+                    logger.error("❌ [ENRICHMENT] [%s/%s] Error enriching %s: %s", idx, total, prospect.domain, e, exc_info=True)
                     failed_count += 1
                     continue
             
-            total_enrichment_time = (time.time() - enrichment_start_time) * 1000
-            logger.info(f"⏱️  [ENRICHMENT] Total enrichment time: {total_enrichment_time:.0f}ms")
+            # One executemany UPDATE + one commit for all prospects instead of a
+            # commit/refresh round-trip per prospect
+            if updates:
+                await _bulk_update_prospects(db, updates)
+            await db.commit()
+            
+            total_enrichment_time = (_now() - enrichment_start_time) * 1000
+            logger.info("⏱️  [ENRICHMENT] Total enrichment time: %.0fms", total_enrichment_time)
             
             # Update job status
             job.status = "completed"
@@ -292,12 +300,14 @@ async def process_enrichment_job(job_id: str) -> Dict[str, Any]:
                 "prospects_enriched": enriched_count,
                 "prospects_failed": failed_count,
                 "prospects_no_email": no_email_count,
-                "total_processed": len(prospects)
+                "total_processed": total
             }
             await db.commit()
             
-            logger.info(f"✅ Enrichment job {job_id} completed:")
-            logger.info(f"   📊 Enriched: {enriched_count}, Failed: {failed_count}, No Email: {no_email_count}")
+            logger.info(
+                "✅ Enrichment job %s completed: 📊 Enriched: %s, Failed: %s, No Email: %s",
+                job_id, enriched_count, failed_count, no_email_count
+            )
             
             return {
                 "job_id": job_id,
@@ -305,19 +315,19 @@ async def process_enrichment_job(job_id: str) -> Dict[str, Any]:
                 "prospects_enriched": enriched_count,
                 "prospects_failed": failed_count,
                 "prospects_no_email": no_email_count,
-                "total_processed": len(prospects)
+                "total_processed": total
             }
             
         except Exception as e:
-            logger.error(f"❌ Enrichment job {job_id} failed: {e}", exc_info=True)
+            logger.error("❌ Enrichment job %s failed: %s", job_id, e, exc_info=True)
             try:
-                result = await db.execute(select(Job).where(Job.id == job_id))
+                result = await db.execute(_GET_JOB, {"job_id": job_id})
                 job = result.scalar_one_or_none()
                 if job:
                     job.status = "failed"
                     job.error_message = str(e)
                     await db.commit()
             except Exception as commit_err:
-                logger.error(f"❌ Failed to commit error status for job {job_id}: {commit_err}", exc_info=True)
+                logger.error("❌ Failed to commit error status for job %s: %s", job_id, commit_err, exc_info=True)
             return {"error": str(e)}
 
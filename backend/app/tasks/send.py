@@ -13,7 +13,7 @@ from app.db.database import AsyncSessionLocal
 from app.models.prospect import Prospect
 from app.models.job import Job
 from app.models.email_log import EmailLog
-from app.clients.gmail import GmailClient
+from app.services.email_sender import _get_gmail_client
 from app.clients.gemini import GeminiClient
 
 logger = logging.getLogger(__name__)
@@ -93,9 +93,9 @@ async def process_send_job(job_id: str) -> Dict[str, Any]:
                     "message": "No prospects to send"
                 }
             
-            # Initialize Gmail client (required)
+            # Reuse the shared Gmail client (required) - its pooled connections outlive this job
             try:
-                gmail_client = GmailClient()
+                gmail_client = await _get_gmail_client()
             except ValueError as e:
                 job.status = "failed"
                 job.error_message = f"Gmail not configured: {e}"
@@ -198,7 +198,7 @@ async def process_send_job(job_id: str) -> Dict[str, Any]:
                         failed_count += 1
                         continue
                     
-                    # Note: send_prospect_email already commits and refreshes prospect
+                    # Note: send_prospect_email already commits the prospect update
                     
                     # Rate limiting (1 email per 2 seconds to avoid Gmail rate limits)
                     await asyncio.sleep(2)
@@ -14,7 +14,7 @@ from app.db.database import AsyncSessionLocal
 from app.models.prospect import Prospect, ScrapeStatus, VerificationStatus, ProspectStage
 from app.models.job import Job
 from app.clients.snov import SnovIOClient
-from app.services.enrichment import _is_snov_email_from_website
+from app.services.enrichment import _is_snov_email_from_website, _verification_domain_search
 
 logger = logging.getLogger(__name__)
 
@@ -131,9 +131,9 @@ async def verify_prospects_async(job_id: str):
                     "message": "No prospects found to verify"
                 }
             
-            # Initialize Snov client
+            # Fail fast if Snov.io is not configured (lookups go through the shared cached domain search)
             try:
-                snov_client = SnovIOClient()
+                SnovIOClient()
             except Exception as e:
                 logger.error(f"❌ [VERIFICATION] Failed to initialize Snov client: {e}")
                 job.status = "failed"
@@ -167,7 +167,7 @@ async def verify_prospects_async(job_id: str):
                         if should_verify:
                             # Verify existing scraped email
                             logger.debug(f"🔍 [VERIFICATION] Calling Snov.io domain_search for {prospect.domain}...")
-                            snov_result = await snov_client.domain_search(prospect.domain)
+                            snov_result = await _verification_domain_search(prospect.domain)
                             logger.debug(f"🔍 [VERIFICATION] Snov.io response for {prospect.domain}: success={snov_result.get('success')}, emails_count={len(snov_result.get('emails', []))}")
                             
                             scraped_email = prospect.contact_email.lower().strip()
@@ -241,7 +241,7 @@ async def verify_prospects_async(job_id: str):
                         prospect.scrape_status == ScrapeStatus.NO_EMAIL_FOUND.value
                     ):
                         # Try domain search via Snov
-                        snov_result = await snov_client.domain_search(prospect.domain)
+                        snov_result = await _verification_domain_search(prospect.domain)
                         
                         if snov_result.get("success") and snov_result.get("emails"):
                             # Find first website-source email
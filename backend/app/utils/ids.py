@@ -0,0 +1,29 @@
+"""
+Primary key generation utilities
+"""
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID version 7 (RFC 9562).
+    
+    Layout: 48-bit unix timestamp (ms) | version | 12 random bits | variant | 62 random bits.
+    New ids sort after older ones, so inserts land on the right-hand side of
+    the primary key B-tree instead of splitting random pages like uuid4.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    rand_a = (rand >> 62) & 0xFFF
+    rand_b = rand & ((1 << 62) - 1)
+    
+    value = (
+        (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | rand_a << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
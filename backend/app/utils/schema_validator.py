@@ -3,56 +3,257 @@ Schema validation utilities - HARD FAIL on schema mismatches
 
 This module provides functions to validate that the database schema
 matches the ORM models exactly. Any mismatch causes a hard failure.
+
+Introspection reads pg_catalog directly - information_schema views are
+privilege-filtered joins over many catalogs and far slower.
 """
+import hashlib
+import json
 import logging
-from typing import Dict, List, Set
+import uuid
+from dataclasses import dataclass
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine, AsyncConnection
 from app.db.database import Base
+from app.models.prospect import Prospect
 
 logger = logging.getLogger(__name__)
 
+# Log banners - each report is emitted as one multi-line record
+_BANNER = "=" * 80
+_BANNER_SHORT = "=" * 60
 
-# Required columns from Prospect model - ALL must exist
-REQUIRED_PROSPECT_COLUMNS = {
-    # Core fields
-    'id', 'domain', 'page_url', 'page_title', 'contact_email', 'contact_method',
-    'da_est', 'score', 'outreach_status', 'last_sent', 'followups_sent',
-    'draft_subject', 'draft_body', 'final_body', 'thread_id', 'sequence_index',
-    'is_manual', 'created_at', 'updated_at',
-    
-    # Pipeline status fields
-    'discovery_status', 'scrape_status', 'approval_status', 'verification_status',
-    'draft_status', 'send_status', 'stage',
-    
-    # Discovery metadata
-    'discovery_query_id', 'discovery_category', 'discovery_location', 'discovery_keywords',
-    
-    # Scraping metadata
-    'scrape_payload', 'scrape_source_url',
-    
-    # Verification metadata
-    'verification_confidence', 'verification_payload',
+
+# Required columns - built from the Prospect model so it cannot drift; ALL must exist
+REQUIRED_PROSPECT_COLUMNS: frozenset = frozenset(c.name for c in Prospect.__table__.columns)
+_REQUIRED_SORTED = tuple(sorted(REQUIRED_PROSPECT_COLUMNS))
+_REQUIRED_COUNT = len(REQUIRED_PROSPECT_COLUMNS)
+
+# Required tables - website pipeline and social outreach
+WEBSITE_TABLES = frozenset({'prospects', 'jobs', 'email_logs', 'settings', 'discovery_queries', 'alembic_version'})
+SOCIAL_TABLES = frozenset({'social_profiles', 'social_discovery_jobs', 'social_drafts', 'social_messages'})
+
+# validate_all() caches a passing verdict in the settings table, keyed by
+# (alembic revision(s), required columns + tables hash) - a match skips introspection
+REQUIRED_SCHEMA_HASH = hashlib.blake2b(
+    ";".join((",".join(_REQUIRED_SORTED), ",".join(sorted(WEBSITE_TABLES | SOCIAL_TABLES)))).encode()
+).hexdigest()
+VALIDATION_CACHE_KEY = "schema_validation"
+
+
+# Postgres SQLSTATEs for a missing alembic_version table / version_num column
+_UNDEFINED_TABLE = "42P01"
+_UNDEFINED_COLUMN = "42703"
+
+# Catalog queries - built once so SQLAlchemy's compiled cache and asyncpg's
+# prepared statements are reused; parameters always go through bind params
+_COLUMN_NAMES_SQL = text("""
+    SELECT a.attname
+    FROM pg_catalog.pg_attribute a
+    JOIN pg_catalog.pg_class c ON a.attrelid = c.oid
+    JOIN pg_catalog.pg_namespace n ON c.relnamespace = n.oid
+    WHERE n.nspname = 'public'
+    AND c.relname = :table_name
+    AND a.attnum > 0
+    AND NOT a.attisdropped
+""")
+_EXISTING_TABLES_SQL = text("""
+    SELECT c.relname
+    FROM pg_catalog.pg_class c
+    JOIN pg_catalog.pg_namespace n ON c.relnamespace = n.oid
+    WHERE n.nspname = 'public'
+    AND c.relkind IN ('r', 'p')
+    AND c.relname = ANY(:tables)
+""")
+_ALEMBIC_VERSION_SQL = text("SELECT version_num FROM alembic_version LIMIT 1")
+_CURRENT_DATABASE_SQL = text("SELECT current_database()")
+_VALIDATION_CACHE_SQL = text("""
+    SELECT
+        (SELECT string_agg(version_num, ',' ORDER BY version_num COLLATE "C") FROM alembic_version),
+        s.value->>'alembic_version',
+        s.value->>'required_hash'
+    FROM (SELECT 1) AS one
+    LEFT JOIN settings s ON s.key = :key
+""")
+_STORE_VALIDATION_CACHE_SQL = text("""
+    INSERT INTO settings (id, key, value)
+    VALUES (:id, :key, CAST(:value AS json))
+    ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, updated_at = now()
+""")
+
+# All startup introspection as one tagged UNION ALL - partitioned by "k" in Python.
+# Prospect columns come back as one count of the required names present (exact -
+# extra columns can't mask a missing one). The alembic_version branch is dropped
+# if that table is missing.
+_SCHEMA_SNAPSHOT_BODY = """
+    SELECT 'ncol' AS k, COUNT(*)::text AS v
+    FROM pg_catalog.pg_attribute a
+    JOIN pg_catalog.pg_class c ON a.attrelid = c.oid
+    JOIN pg_catalog.pg_namespace n ON c.relnamespace = n.oid
+    WHERE n.nspname = 'public' AND c.relname = 'prospects'
+    AND a.attnum > 0 AND NOT a.attisdropped
+    AND a.attname = ANY(:required)
+    UNION ALL
+    SELECT 'acol', a.attname::text
+    FROM pg_catalog.pg_attribute a
+    JOIN pg_catalog.pg_class c ON a.attrelid = c.oid
+    JOIN pg_catalog.pg_namespace n ON c.relnamespace = n.oid
+    WHERE n.nspname = 'public' AND c.relname = 'alembic_version'
+    AND a.attnum > 0 AND NOT a.attisdropped
+    UNION ALL
+    SELECT 'tbl', c.relname::text
+    FROM pg_catalog.pg_class c
+    JOIN pg_catalog.pg_namespace n ON c.relnamespace = n.oid
+    WHERE n.nspname = 'public' AND c.relkind IN ('r', 'p')
+    AND c.relname = ANY(:tables)
+"""
+_SCHEMA_SNAPSHOT_NO_VERSION_SQL = text(_SCHEMA_SNAPSHOT_BODY)
+_SCHEMA_SNAPSHOT_SQL = text(_SCHEMA_SNAPSHOT_BODY + """
+    UNION ALL
+    SELECT 'ver', version_num::text FROM alembic_version
+""")
+
+
+@asynccontextmanager
+async def introspection_connection(engine: AsyncEngine):
+    """
+    One pooled connection in AUTOCOMMIT for read-only catalog queries.
     
-    # API responses
-    'dataforseo_payload', 'snov_payload',
+    No BEGIN/COMMIT round-trips, and a failed probe doesn't abort later ones.
+    """
+    async with engine.connect() as conn:
+        yield await conn.execution_options(isolation_level="AUTOCOMMIT")
+
+
+async def _get_column_names(db, table_name: str) -> Set[str]:
+    """Column names of a public table via pg_catalog (db: AsyncSession or AsyncConnection)"""
+    result = await db.execute(_COLUMN_NAMES_SQL, {"table_name": table_name})
+    return set(result.scalars())
+
+
+async def _get_existing_tables(db, table_names: Set[str]) -> Set[str]:
+    """Which of table_names exist as public tables, via pg_catalog"""
+    result = await db.execute(_EXISTING_TABLES_SQL, {"tables": list(table_names)})
+    return set(result.scalars())
+
+
+async def _fetch_schema_snapshot(conn: AsyncConnection) -> Dict:
+    """
+    Required prospect column count, alembic_version columns/rows and required tables in one round-trip.
     
-    # SERP intent
-    'serp_intent', 'serp_confidence', 'serp_signals',
+    Falls back to the query without alembic_version rows if that table is missing.
+    """
+    params = {"tables": list(WEBSITE_TABLES | SOCIAL_TABLES), "required": list(_REQUIRED_SORTED)}
+    try:
+        result = await conn.execute(_SCHEMA_SNAPSHOT_SQL, params)
+    except Exception:
+        await conn.rollback()
+        result = await conn.execute(_SCHEMA_SNAPSHOT_NO_VERSION_SQL, params)
     
-    # Social outreach fields
-    'source_type', 'source_platform', 'profile_url', 'username', 'display_name',
-    'follower_count', 'engagement_rate',
+    snapshot = {"ncol": 0, "acol": set(), "tbl": set(), "ver": []}
+    for k, v in result.fetchall():
+        if k == "ncol":
+            snapshot["ncol"] = int(v)
+        elif k == "ver":
+            snapshot["ver"].append(v)
+        else:
+            snapshot[k].add(v)
+    return snapshot
+
+
+async def validate_all_tables_exist(conn: AsyncConnection) -> Dict:
+    """
+    Check website and social tables in a single round-trip.
     
-    # Realtime scraping fields
-    'bio_text', 'external_links', 'scraped_at',
-}
+    Returns:
+        Dict keyed by "website" and "social", each with:
+        - valid: bool
+        - missing_tables: List[str]
+    """
+    return _tables_result(await _get_existing_tables(conn, WEBSITE_TABLES | SOCIAL_TABLES))
+
+
+def _tables_result(existing_tables: Set[str]) -> Dict:
+    """Partition missing required tables into website/social groups"""
+    tables = {}
+    for group, group_tables in (("website", WEBSITE_TABLES), ("social", SOCIAL_TABLES)):
+        missing_tables = [] if group_tables.issubset(existing_tables) else sorted(group_tables - existing_tables)
+        tables[group] = {"valid": not missing_tables, "missing_tables": missing_tables}
+    return tables
+
+
+async def validate_website_tables_exist(conn: AsyncConnection, all_tables: Optional[Dict] = None) -> Dict:
+    """Website slice of validate_all_tables_exist() (reuses all_tables if already fetched)"""
+    if all_tables is None:
+        all_tables = await validate_all_tables_exist(conn)
+    return all_tables["website"]
+
+
+async def validate_social_tables_exist(conn: AsyncConnection, all_tables: Optional[Dict] = None) -> Dict:
+    """Social slice of validate_all_tables_exist() (reuses all_tables if already fetched)"""
+    if all_tables is None:
+        all_tables = await validate_all_tables_exist(conn)
+    return all_tables["social"]
+
+
+async def _get_validation_cache(conn: AsyncConnection) -> Dict:
+    """Current alembic revision(s) and the cached verdict's key, in one query"""
+    result = await conn.execute(_VALIDATION_CACHE_SQL, {"key": VALIDATION_CACHE_KEY})
+    row = result.fetchone()
+    return {"alembic_version": row[0], "cached_version": row[1], "cached_hash": row[2]}
+
+
+def _revision_key(versions: List[str]) -> str:
+    """Cache key for alembic_version rows - same string as _VALIDATION_CACHE_SQL's string_agg"""
+    return ",".join(sorted(versions))
+
+
+async def _store_validation_cache(conn: AsyncConnection, alembic_version: str) -> None:
+    """Record a passing validate_all() for alembic_version + REQUIRED_SCHEMA_HASH"""
+    value = {
+        "alembic_version": alembic_version,
+        "required_hash": REQUIRED_SCHEMA_HASH,
+        "validated_at": datetime.now(timezone.utc).isoformat(),
+    }
+    await conn.execute(
+        _STORE_VALIDATION_CACHE_SQL,
+        {"id": uuid.uuid4(), "key": VALIDATION_CACHE_KEY, "value": json.dumps(value)}
+    )
+    await conn.commit()
+
+
+def _cached_results(alembic_version: str) -> Dict:
+    """validate_all() results for a cache hit - every check passed at this revision"""
+    return {
+        "prospect_schema": {
+            "valid": True,
+            "missing_columns": [],
+            "existing_columns": None,
+            "cached": True,
+            "error": None
+        },
+        "alembic_version": {
+            "valid": True,
+            "table_exists": True,
+            "current_version": alembic_version,
+            "cached": True,
+            "error": None
+        },
+        "tables": {group: {"valid": True, "missing_tables": []} for group in ("website", "social")},
+    }
 
 
 async def validate_prospect_schema(db: AsyncSession) -> Dict:
     """
     Validate that prospects table has ALL required columns from Prospect model.
     
+    Args:
+        db: Database session
+    
     Returns:
         Dict with validation results:
         - valid: bool
@@ -64,55 +265,85 @@ async def validate_prospect_schema(db: AsyncSession) -> Dict:
         Exception: If any required column is missing (HARD FAIL)
     """
     try:
-        # Get all columns from prospects table
-        result = await db.execute(text("""
-            SELECT column_name, data_type, is_nullable
-            FROM information_schema.columns 
-            WHERE table_name = 'prospects'
-            AND table_schema = 'public'
-            ORDER BY column_name
-        """))
-        db_columns = {row[0]: {'type': row[1], 'nullable': row[2]} for row in result.fetchall()}
-        
-        # Check for missing required columns
-        missing_columns = REQUIRED_PROSPECT_COLUMNS - set(db_columns.keys())
-        
-        if missing_columns:
-            error_msg = f"CRITICAL: prospects table is missing {len(missing_columns)} required columns: {', '.join(sorted(missing_columns))}"
-            logger.error("=" * 80)
-            logger.error(f"❌ {error_msg}")
-            logger.error("=" * 80)
-            logger.error("❌ This indicates a schema mismatch that will cause query failures")
-            logger.error("❌ ABORTING STARTUP TO PREVENT DATA CORRUPTION")
-            logger.error("=" * 80)
-            
-            return {
-                "valid": False,
-                "missing_columns": sorted(missing_columns),
-                "existing_columns": sorted(db_columns.keys()),
-                "error": error_msg
-            }
-        
-        logger.info("=" * 60)
-        logger.info("✅ PROSPECT SCHEMA VALIDATION PASSED")
-        logger.info(f"   All {len(REQUIRED_PROSPECT_COLUMNS)} required columns exist")
-        logger.info("=" * 60)
-        
-        return {
-            "valid": True,
-            "missing_columns": [],
-            "existing_columns": sorted(db_columns.keys()),
-            "error": None
-        }
+        return _prospect_schema_result(await _get_column_names(db, 'prospects'))
         
     except Exception as e:
         error_msg = f"Schema validation failed: {str(e)}"
-        logger.error("=" * 80)
-        logger.error(f"❌ {error_msg}")
-        logger.error("=" * 80)
+        logger.error("\n".join([
+            _BANNER,
+            f"❌ {error_msg}",
+            _BANNER,
+        ]))
         raise Exception(error_msg) from e
 
 
+def validate_prospect_schema_sync(sync_url: str) -> Dict:
+    """
+    Synchronous validate_prospect_schema for scripts without an event loop.
+    
+    One-shot psycopg2 connection (no pool, no asyncpg setup); same result dict.
+    
+    Args:
+        sync_url: postgresql:// (psycopg2) database URL
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.engine import make_url
+    from sqlalchemy.pool import NullPool
+    
+    # Pin the driver to psycopg2 (the one in requirements.txt)
+    url = make_url(sync_url).set(drivername="postgresql+psycopg2")
+    sync_engine = create_engine(url, poolclass=NullPool)
+    try:
+        with sync_engine.connect() as conn:
+            db_columns = set(conn.execute(_COLUMN_NAMES_SQL, {"table_name": "prospects"}).scalars())
+        return _prospect_schema_result(db_columns)
+    finally:
+        sync_engine.dispose()
+
+
+def _prospect_schema_result(db_columns: Optional[Set[str]]) -> Dict:
+    """
+    Compare prospects columns against REQUIRED_PROSPECT_COLUMNS.
+    
+    db_columns=None means the required-column count already matched and the
+    names were not read; the passing result then has existing_columns=None.
+    """
+    # Check for missing required columns - the difference is only built on failure
+    if db_columns is not None and not REQUIRED_PROSPECT_COLUMNS.issubset(db_columns):
+        missing_columns = REQUIRED_PROSPECT_COLUMNS - db_columns
+        missing_sorted = [c for c in _REQUIRED_SORTED if c in missing_columns]
+        error_msg = f"CRITICAL: prospects table is missing {len(missing_sorted)} required columns: {', '.join(missing_sorted)}"
+        logger.error("\n".join([
+            _BANNER,
+            f"❌ {error_msg}",
+            _BANNER,
+            "❌ This indicates a schema mismatch that will cause query failures",
+            "❌ ABORTING STARTUP TO PREVENT DATA CORRUPTION",
+            _BANNER,
+        ]))
+        
+        return {
+            "valid": False,
+            "missing_columns": missing_sorted,
+            "existing_columns": sorted(db_columns),
+            "error": error_msg
+        }
+    
+    logger.info("\n".join([
+        _BANNER_SHORT,
+        "✅ PROSPECT SCHEMA VALIDATION PASSED",
+        f"   All {_REQUIRED_COUNT} required columns exist",
+        _BANNER_SHORT,
+    ]))
+    
+    return {
+        "valid": True,
+        "missing_columns": [],
+        "existing_columns": sorted(db_columns) if db_columns is not None else None,
+        "error": None
+    }
+
+
 async def validate_alembic_version_table(db: AsyncSession) -> Dict:
     """
     Validate that alembic_version table exists and has correct structure.
@@ -124,73 +355,190 @@ async def validate_alembic_version_table(db: AsyncSession) -> Dict:
         Exception: If alembic_version table is missing or corrupted
     """
     try:
-        # Check if table exists
-        table_check = await db.execute(text("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                AND table_name = 'alembic_version'
-            )
-        """))
-        table_exists = table_check.scalar()
+        # One query on the happy path: reading version_num proves the table and
+        # column exist; a missing table/column surfaces as its SQLSTATE
+        try:
+            version_result = await db.execute(_ALEMBIC_VERSION_SQL)
+        except DBAPIError as e:
+            sqlstate = getattr(e.orig, "sqlstate", None) or getattr(e.orig, "pgcode", None)
+            if sqlstate not in (_UNDEFINED_TABLE, _UNDEFINED_COLUMN):
+                raise
+            await db.rollback()
+            if sqlstate == _UNDEFINED_TABLE:
+                return _alembic_version_result(False, set(), [])
+            return _alembic_version_result(True, set(), [])
         
-        if not table_exists:
-            error_msg = "CRITICAL: alembic_version table does not exist - Alembic will re-run all migrations from base"
-            logger.error("=" * 80)
-            logger.error(f"❌ {error_msg}")
-            logger.error("=" * 80)
-            logger.error("❌ This will cause schema corruption and data loss")
-            logger.error("❌ ABORTING STARTUP")
-            logger.error("=" * 80)
-            
-            return {
-                "valid": False,
-                "table_exists": False,
-                "error": error_msg
-            }
-        
-        # Check table structure
-        column_check = await db.execute(text("""
-            SELECT column_name, data_type 
-            FROM information_schema.columns 
-            WHERE table_name = 'alembic_version' 
-            AND table_schema = 'public'
-        """))
-        columns = {row[0]: row[1] for row in column_check.fetchall()}
-        
-        if 'version_num' not in columns:
-            error_msg = "CRITICAL: alembic_version table exists but missing version_num column - table structure is corrupted"
-            logger.error("=" * 80)
-            logger.error(f"❌ {error_msg}")
-            logger.error("=" * 80)
-            raise Exception(error_msg)
-        
-        # Get current version
-        version_result = await db.execute(text("SELECT version_num FROM alembic_version LIMIT 1"))
-        version_row = version_result.fetchone()
-        current_version = version_row[0] if version_row else None
-        
-        logger.info("=" * 60)
-        logger.info("✅ ALEMBIC_VERSION TABLE VALIDATION PASSED")
-        logger.info(f"   Table exists: ✅")
-        logger.info(f"   Current version: {current_version}")
-        logger.info("=" * 60)
-        
-        return {
-            "valid": True,
-            "table_exists": True,
-            "current_version": current_version,
-            "error": None
-        }
+        return _alembic_version_result(True, {'version_num'}, version_result.scalars().all())
         
     except Exception as e:
         error_msg = f"Alembic version table validation failed: {str(e)}"
-        logger.error("=" * 80)
-        logger.error(f"❌ {error_msg}")
-        logger.error("=" * 80)
+        logger.error("\n".join([
+            _BANNER,
+            f"❌ {error_msg}",
+            _BANNER,
+        ]))
         raise Exception(error_msg) from e
 
 
+def _alembic_version_result(table_exists: bool, columns: Set[str], versions: List[str]) -> Dict:
+    """
+    Evaluate alembic_version presence, structure and current revision.
+    
+    Raises:
+        Exception: If the table exists but has no version_num column
+    """
+    if not table_exists:
+        error_msg = "CRITICAL: alembic_version table does not exist - Alembic will re-run all migrations from base"
+        logger.error("\n".join([
+            _BANNER,
+            f"❌ {error_msg}",
+            _BANNER,
+            "❌ This will cause schema corruption and data loss",
+            "❌ ABORTING STARTUP",
+            _BANNER,
+        ]))
+        
+        return {
+            "valid": False,
+            "table_exists": False,
+            "error": error_msg
+        }
+    
+    if 'version_num' not in columns:
+        error_msg = "CRITICAL: alembic_version table exists but missing version_num column - table structure is corrupted"
+        logger.error("\n".join([
+            _BANNER,
+            f"❌ {error_msg}",
+            _BANNER,
+        ]))
+        raise Exception(error_msg)
+    
+    current_version = versions[0] if versions else None
+    
+    logger.info("\n".join([
+        _BANNER_SHORT,
+        "✅ ALEMBIC_VERSION TABLE VALIDATION PASSED",
+        f"   Table exists: ✅",
+        f"   Current version: {current_version}",
+        _BANNER_SHORT,
+    ]))
+    
+    return {
+        "valid": True,
+        "table_exists": True,
+        "current_version": current_version,
+        "error": None
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaValidationFailure:
+    """One failed check - the message is only rendered when formatted"""
+    check: str
+    missing: frozenset = frozenset()
+    detail: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self.missing:
+            return f"{self.check}: missing {len(self.missing)}: {', '.join(sorted(self.missing))}"
+        return f"{self.check}: {self.detail}"
+
+
+class SchemaValidationError(Exception):
+    """Raised by validate_all() with every failed schema check, not just the first"""
+
+    def __init__(self, failures: List[SchemaValidationFailure], results: Dict):
+        super().__init__()
+        self.failures = failures
+        self.results = results
+
+    def __str__(self) -> str:
+        return "; ".join(map(str, self.failures))
+
+
+async def validate_all(engine: AsyncEngine, use_cache: bool = True) -> Dict:
+    """Engine wrapper for validate_all_on_connection() (see introspection_connection)"""
+    async with introspection_connection(engine) as conn:
+        return await validate_all_on_connection(conn, use_cache)
+
+
+async def validate_all_on_connection(conn: AsyncConnection, use_cache: bool = True) -> Dict:
+    """
+    Run the prospect column, alembic_version and table checks from one snapshot.
+    
+    All introspection is a single UNION ALL round-trip (_fetch_schema_snapshot),
+    plus a column-name read only when required prospect columns are missing.
+    
+    Args:
+        conn: Connection to introspect
+        use_cache: Skip the snapshot when this alembic revision + required schema
+            already passed; a passing run always refreshes the cache
+    
+    Returns:
+        Dict with "prospect_schema", "alembic_version" and "tables" results
+    
+    Raises:
+        SchemaValidationError: If any check failed or raised
+    """
+    if use_cache:
+        try:
+            cache = await _get_validation_cache(conn)
+            revision = cache["alembic_version"]
+            if revision and cache["cached_version"] == revision and cache["cached_hash"] == REQUIRED_SCHEMA_HASH:
+                logger.info(f"✅ SCHEMA VALIDATION PASSED (cached validation hit for revision {revision})")
+                return _cached_results(revision)
+        except Exception as cache_err:
+            # Cache is an optimization only - fall back to full validation
+            await conn.rollback()
+            logger.warning(f"⚠️  Schema validation cache unavailable: {cache_err}")
+    
+    snapshot = await _fetch_schema_snapshot(conn)
+    # Count mismatch - fetch all prospect columns for a precise missing-columns report
+    prospect_columns = None
+    if snapshot["ncol"] != _REQUIRED_COUNT:
+        prospect_columns = await _get_column_names(conn, 'prospects')
+    
+    checks = {
+        "prospect_schema": lambda: _prospect_schema_result(prospect_columns),
+        "alembic_version": lambda: _alembic_version_result(
+            "alembic_version" in snapshot["tbl"], snapshot["acol"], snapshot["ver"]
+        ),
+        "tables": lambda: _tables_result(snapshot["tbl"]),
+    }
+    results = {}
+    failures = []
+    for name, check in checks.items():
+        try:
+            results[name] = check()
+        except Exception as e:
+            results[name] = e
+            failures.append(SchemaValidationFailure(name, detail=str(e)))
+    
+    prospect_schema = results["prospect_schema"]
+    if isinstance(prospect_schema, dict) and not prospect_schema["valid"]:
+        failures.append(SchemaValidationFailure("prospect_schema", missing=frozenset(prospect_schema["missing_columns"])))
+    alembic_result = results["alembic_version"]
+    if isinstance(alembic_result, dict) and not alembic_result["valid"]:
+        failures.append(SchemaValidationFailure("alembic_version", detail=alembic_result["error"]))
+    tables = results["tables"]
+    if isinstance(tables, dict):
+        for group, group_result in tables.items():
+            if not group_result["valid"]:
+                failures.append(SchemaValidationFailure(f"{group}_tables", missing=frozenset(group_result["missing_tables"])))
+    
+    if failures:
+        raise SchemaValidationError(failures, results)
+    
+    # Keyed by the revision string _get_validation_cache() reads back
+    if snapshot["ver"]:
+        try:
+            await _store_validation_cache(conn, _revision_key(snapshot["ver"]))
+        except Exception as cache_err:
+            await conn.rollback()
+            logger.warning(f"⚠️  Could not store schema validation cache: {cache_err}")
+    return results
+
+
 async def get_full_schema_diagnostics(engine: AsyncEngine) -> Dict:
     """
     Get comprehensive schema diagnostics comparing database to ORM models.
@@ -202,14 +550,14 @@ async def get_full_schema_diagnostics(engine: AsyncEngine) -> Dict:
         JSON-serializable dict containing:
         - alembic_revision: Current Alembic revision from alembic_version table
         - database_name: Name of the connected database
-        - db_columns: List of columns in prospects table (from information_schema)
+        - db_columns: List of columns in prospects table (from pg_catalog)
         - model_columns: List of columns defined in Prospect model
         - schema_match: Boolean indicating if model columns ⊆ db columns
         - status: "ok" or "error"
         - all_tables_valid: Boolean indicating if all required tables exist
     """
     try:
-        async with engine.begin() as conn:
+        async with introspection_connection(engine) as conn:
             diagnostics = {
                 "status": "ok",
                 "alembic_revision": None,
@@ -218,13 +566,15 @@ async def get_full_schema_diagnostics(engine: AsyncEngine) -> Dict:
                 "model_columns": [],
                 "schema_match": False,
                 "all_tables_valid": False,
+                "social_tables_valid": False,
+                "missing_tables": [],
                 "missing_columns": [],
                 "extra_columns": []
             }
             
             # Get database name
             try:
-                db_info_result = await conn.execute(text("SELECT current_database()"))
+                db_info_result = await conn.execute(_CURRENT_DATABASE_SQL)
                 db_name = db_info_result.scalar()
                 diagnostics["database_name"] = db_name
             except Exception as e:
@@ -232,23 +582,14 @@ async def get_full_schema_diagnostics(engine: AsyncEngine) -> Dict:
             
             # Get Alembic revision
             try:
-                version_result = await conn.execute(text("SELECT version_num FROM alembic_version LIMIT 1"))
-                version_row = version_result.fetchone()
-                if version_row:
-                    diagnostics["alembic_revision"] = version_row[0]
+                version_result = await conn.execute(_ALEMBIC_VERSION_SQL)
+                diagnostics["alembic_revision"] = version_result.scalar()
             except Exception as e:
                 logger.warning(f"Could not get Alembic revision: {e}")
             
-            # Get actual database columns from information_schema
+            # Get actual database columns from pg_catalog
             try:
-                columns_result = await conn.execute(text("""
-                    SELECT column_name, data_type, is_nullable
-            FROM information_schema.columns 
-            WHERE table_name = 'prospects'
-                    AND table_schema = 'public'
-                    ORDER BY column_name
-        """))
-                db_columns = [row[0] for row in columns_result.fetchall()]
+                db_columns = sorted(await _get_column_names(conn, 'prospects'))
                 diagnostics["db_columns"] = db_columns
             except Exception as e:
                 logger.error(f"Could not get database columns: {e}")
@@ -265,11 +606,11 @@ async def get_full_schema_diagnostics(engine: AsyncEngine) -> Dict:
                 else:
                     logger.warning("prospects table not found in Base.metadata.tables")
                     # Fallback: use REQUIRED_PROSPECT_COLUMNS
-                    diagnostics["model_columns"] = sorted(REQUIRED_PROSPECT_COLUMNS)
+                    diagnostics["model_columns"] = list(_REQUIRED_SORTED)
             except Exception as e:
                 logger.error(f"Could not get model columns: {e}")
                 # Fallback: use REQUIRED_PROSPECT_COLUMNS
-                diagnostics["model_columns"] = sorted(REQUIRED_PROSPECT_COLUMNS)
+                diagnostics["model_columns"] = list(_REQUIRED_SORTED)
             
             # Compare: model columns must be subset of db columns
             db_columns_set = set(db_columns)
@@ -282,17 +623,14 @@ async def get_full_schema_diagnostics(engine: AsyncEngine) -> Dict:
             diagnostics["extra_columns"] = sorted(extra_columns)
             diagnostics["schema_match"] = len(missing_columns) == 0
             
-            # Check if all required tables exist
+            # Check if all required tables exist (website + social in one query)
             try:
-                tables_result = await conn.execute(text("""
-                    SELECT table_name 
-                    FROM information_schema.tables 
-                    WHERE table_schema = 'public' 
-                    AND table_type = 'BASE TABLE'
-                """))
-                existing_tables = {row[0] for row in tables_result.fetchall()}
-                required_tables = {'prospects', 'jobs', 'email_logs', 'settings', 'discovery_queries', 'alembic_version'}
-                diagnostics["all_tables_valid"] = required_tables.issubset(existing_tables)
+                all_tables = await validate_all_tables_exist(conn)
+                website_tables = await validate_website_tables_exist(conn, all_tables)
+                social_tables = await validate_social_tables_exist(conn, all_tables)
+                diagnostics["all_tables_valid"] = website_tables["valid"]
+                diagnostics["social_tables_valid"] = social_tables["valid"]
+                diagnostics["missing_tables"] = website_tables["missing_tables"] + social_tables["missing_tables"]
             except Exception as e:
                 logger.warning(f"Could not check required tables: {e}")
             
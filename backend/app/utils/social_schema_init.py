@@ -8,7 +8,7 @@ This is a safety net - migrations should handle table creation,
 but this provides graceful degradation if migrations fail.
 """
 from sqlalchemy.ext.asyncio import AsyncEngine
-from sqlalchemy import create_engine, inspect, text
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import sessionmaker
 import logging
 import os
@@ -29,28 +29,13 @@ async def ensure_social_tables_exist(engine: AsyncEngine) -> Tuple[bool, List[st
         - success: True if all tables now exist
         - missing_tables: List of tables that still don't exist (empty if success)
     """
-    required_tables = {
-        'social_profiles',
-        'social_discovery_jobs',
-        'social_drafts',
-        'social_messages'
-    }
+    from app.utils.schema_validator import SOCIAL_TABLES, introspection_connection, validate_social_tables_exist
+    required_tables = SOCIAL_TABLES
     
     try:
         # Check which tables exist
-        async with engine.begin() as conn:
-            tables_tuple = tuple(required_tables)
-            result = await conn.execute(
-                text("""
-                    SELECT table_name 
-                    FROM information_schema.tables 
-                    WHERE table_schema = 'public' 
-                    AND table_name = ANY(:tables)
-                """),
-                {"tables": tables_tuple}
-            )
-            existing_tables = {row[0] for row in result.fetchall()}
-            missing_tables = required_tables - existing_tables
+        async with introspection_connection(engine) as conn:
+            missing_tables = set((await validate_social_tables_exist(conn))["missing_tables"])
         
         if not missing_tables:
             logger.info("✅ All social outreach tables exist")
@@ -87,12 +72,7 @@ async def ensure_social_tables_exist(engine: AsyncEngine) -> Tuple[bool, List[st
         try:
             # Create only social tables
             # We need to filter Base.metadata.tables to only include social tables
-            social_table_names = {
-                'social_profiles',
-                'social_discovery_jobs',
-                'social_drafts',
-                'social_messages'
-            }
+            social_table_names = SOCIAL_TABLES
             
             # Create tables that are missing
             with sync_engine.begin() as sync_conn:
@@ -106,18 +86,8 @@ async def ensure_social_tables_exist(engine: AsyncEngine) -> Tuple[bool, List[st
                         logger.info(f"✅ Created table: {table_name}")
             
             # Verify tables were created
-            async with engine.begin() as conn:
-                result = await conn.execute(
-                    text("""
-                        SELECT table_name 
-                        FROM information_schema.tables 
-                        WHERE table_schema = 'public' 
-                        AND table_name = ANY(:tables)
-                    """),
-                    {"tables": tables_tuple}
-                )
-                existing_tables_after = {row[0] for row in result.fetchall()}
-                still_missing = required_tables - existing_tables_after
+            async with introspection_connection(engine) as conn:
+                still_missing = (await validate_social_tables_exist(conn))["missing_tables"]
             
             if still_missing:
                 logger.error(f"❌ Failed to create tables: {', '.join(still_missing)}")
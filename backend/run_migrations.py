@@ -46,6 +46,7 @@ def run_migrations():
         logger.info(f"📡 Database URL: {database_url[:50]}...")
         
         # Convert asyncpg URL to psycopg2 for Alembic
+        sync_url = database_url
         if database_url.startswith("postgresql+asyncpg://"):
             sync_url = database_url.replace("postgresql+asyncpg://", "postgresql://")
             alembic_cfg.set_main_option("sqlalchemy.url", sync_url)
@@ -60,28 +61,17 @@ def run_migrations():
         # Verify schema
         logger.info("🔍 Verifying schema...")
         try:
-            from sqlalchemy import create_engine, text
-            from sqlalchemy.ext.asyncio import create_async_engine
+            # Sync validator - no event loop or async pool needed in this script
+            from app.utils.schema_validator import validate_prospect_schema_sync
             
-            # Create async engine for validation
-            engine = create_async_engine(database_url, echo=False)
+            validation_result = validate_prospect_schema_sync(sync_url)
+            is_valid = validation_result["valid"]
             
-            async def verify_schema():
-                from app.db.database import Base
-                from app.utils.schema_validator import validate_prospect_schema
-                
-                is_valid, missing_columns = await validate_prospect_schema(engine, Base)
-                
-                if not is_valid:
-                    logger.error(f"❌ Schema validation failed: Missing columns {missing_columns}")
-                    logger.error("   Run ensure_prospect_schema() to fix automatically")
-                    return False
-                else:
-                    logger.info("✅ Schema validation passed: ORM model matches database")
-                    return True
-            
-            import asyncio
-            is_valid = asyncio.run(verify_schema())
+            if not is_valid:
+                logger.error(f"❌ Schema validation failed: Missing columns {validation_result['missing_columns']}")
+                logger.error("   Run ensure_prospect_schema() to fix automatically")
+            else:
+                logger.info("✅ Schema validation passed: ORM model matches database")
             
             if not is_valid:
                 logger.warning("⚠️  Schema validation failed, but migrations completed")
@@ -0,0 +1,42 @@
+"""
+Unit tests for the shared Gmail client in the email sending service
+"""
+import asyncio
+from app.services import email_sender
+
+
+class _FakeGmailClient:
+    def __init__(self, refresh_token):
+        self.refresh_token = refresh_token
+        self.closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+def test_shared_gmail_client_rebuilt_on_credential_change(monkeypatch):
+    """Test that the shared client is reused until the Gmail credentials change"""
+    for name in email_sender._GMAIL_CREDENTIAL_ENV:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("GMAIL_REFRESH_TOKEN", "token-1")
+    monkeypatch.setattr(email_sender, "_gmail_client", None)
+    monkeypatch.setattr(email_sender, "_gmail_client_key", None)
+
+    async def fake_init():
+        return _FakeGmailClient(email_sender.os.getenv("GMAIL_REFRESH_TOKEN"))
+
+    monkeypatch.setattr(email_sender, "_init_gmail_client", fake_init)
+
+    async def run():
+        first = await email_sender._get_gmail_client()
+        again = await email_sender._get_gmail_client()
+        monkeypatch.setenv("GMAIL_REFRESH_TOKEN", "token-2")
+        rebuilt = await email_sender._get_gmail_client()
+        return first, again, rebuilt
+
+    first, again, rebuilt = asyncio.run(run())
+
+    assert again is first
+    assert rebuilt is not first and rebuilt.refresh_token == "token-2"
+    assert first.closed, "Replaced client must release its HTTP pool"
+    assert not rebuilt.closed
@@ -0,0 +1,184 @@
+"""
+Unit tests for enrichment service helpers (HTML email extraction, payload compaction)
+"""
+import asyncio
+import time
+from datetime import timezone
+import httpx
+from app.services import enrichment
+from app.services.enrichment import (
+    _extract_emails_from_html,
+    _compact_enrichment_payload,
+    _enrichment_payload_columns,
+    _EMAIL_RE,
+    _PAYLOAD_MAX_EMAILS,
+    _SCRAPE_MAX_CHARS,
+)
+
+
+def test_email_pattern_bounds():
+    """Test that local parts over 64 chars and DNS labels over 63 chars don't match"""
+    assert _EMAIL_RE.search("a" * 64 + "@acme.com").group(0) == "a" * 64 + "@acme.com"
+    assert _EMAIL_RE.search("a" * 65 + "@acme.com") is None
+    assert _EMAIL_RE.search("info@" + "b" * 63 + ".com") is not None
+    assert _EMAIL_RE.search("info@" + "b" * 64 + ".com") is None
+
+
+def test_email_pattern_long_dotted_run():
+    """Test that long runs of dots and dashes scan in linear time without a match"""
+    start = time.perf_counter()
+    assert _EMAIL_RE.search("info@" + "a-." * 20000 + "!") is None
+    assert time.perf_counter() - start < 1.0
+
+
+def _scrape(monkeypatch, html: str):
+    """Run _scrape_email_from_url against a mocked page body"""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, text=html)))
+    monkeypatch.setattr(enrichment, "_get_scrape_client", lambda: client)
+
+    async def run():
+        try:
+            return await enrichment._scrape_email_from_url("https://acme.com/contact", "acme.com")
+        finally:
+            await client.aclose()
+
+    return asyncio.run(run())
+
+
+def test_scrape_reads_email_within_cap(monkeypatch):
+    """Test that an email inside the first _SCRAPE_MAX_CHARS is found"""
+    html = "<p>" + "x " * 1000 + "contact@acme.com</p>" + "y " * 1000
+
+    assert _scrape(monkeypatch, html) == "contact@acme.com"
+
+
+def test_scrape_stops_at_cap(monkeypatch):
+    """Test that content after the 1M-character cap is never scanned"""
+    html = "<p>" + "x" * (_SCRAPE_MAX_CHARS + 100_000) + " contact@acme.com</p>"
+
+    assert _scrape(monkeypatch, html) is None
+
+
+def test_extract_emails_priorities():
+    """Test that mailto links and domain matches are ranked highest"""
+    html = """
+    <a href="mailto:owner@acme.com">Owner</a>
+    <a href="mailto:agency@other.org">Agency</a>
+    <p>Write to info@acme.com, jane@acme.com, sales@partner.org or bob@partner.org</p>
+    """
+    result = _extract_emails_from_html(html, "acme.com")
+
+    assert result == [
+        ("owner@acme.com", 100),
+        ("agency@other.org", 90),
+        ("info@acme.com", 80),
+        ("jane@acme.com", 70),
+        ("sales@partner.org", 60),
+        ("bob@partner.org", 50),
+    ]
+
+
+def test_extract_emails_deduplicates():
+    """Test that an address seen in a mailto link and in text is reported once"""
+    html = '<a href="mailto:info@acme.com">info@acme.com</a> <p>info@acme.com</p>'
+
+    assert _extract_emails_from_html(html, "acme.com") == [("info@acme.com", 100)]
+
+
+def test_extract_emails_empty():
+    """Test that empty HTML yields no emails"""
+    assert _extract_emails_from_html("", "acme.com") == []
+    assert _extract_emails_from_html("<p>no contact here</p>", "acme.com") == []
+
+
+def test_extract_emails_blocklist():
+    """Test that placeholder, no-reply and tracker addresses are skipped"""
+    html = """
+    <p>noreply@acme.com no-reply@acme.com donotreply@acme.com test@acme.com</p>
+    <p>abc123@sentry.io site@wix.com user@example.com</p>
+    <p>contact@acme.com</p>
+    """
+    result = _extract_emails_from_html(html, "acme.com")
+
+    assert [email for email, _ in result] == ["contact@acme.com"]
+
+
+def test_extract_emails_case_insensitive():
+    """Test that the (?i) patterns match mixed-case mailto links and addresses"""
+    html = '<a href="MailTo:Info@ACME.com">Mail</a> <p>SALES@Partner.ORG</p>'
+    result = _extract_emails_from_html(html, "acme.com")
+
+    assert result == [("info@acme.com", 100), ("sales@partner.org", 60)]
+
+
+def test_compact_payload_keys():
+    """Test that compaction drops emails_by_page and domain and keeps the rest"""
+    enrich_result = {
+        "emails": ["info@acme.com"],
+        "primary_email": "info@acme.com",
+        "email_status": "found",
+        "pages_crawled": ["https://acme.com/contact"],
+        "emails_by_page": {"https://acme.com/contact": ["info@acme.com"]},
+        "snov_emails_accepted": 0,
+        "snov_emails_rejected": 1,
+        "domain": "acme.com",
+        "success": True,
+        "source": "html_scraping",
+        "error": None,
+    }
+    payload = _compact_enrichment_payload(enrich_result)
+
+    assert set(payload) == set(enrich_result) - {"emails_by_page", "domain"} | {"fetched_at"}
+    assert isinstance(payload["fetched_at"], int)
+    assert "emails_by_page" in enrich_result, "Input must not be mutated"
+
+
+def test_compact_payload_caps_emails():
+    """Test that at most _PAYLOAD_MAX_EMAILS emails are kept, in order"""
+    emails = [f"user{i}@acme.com" for i in range(_PAYLOAD_MAX_EMAILS + 5)]
+    payload = _compact_enrichment_payload({"emails": emails})
+
+    assert payload["emails"] == emails[:_PAYLOAD_MAX_EMAILS]
+
+
+def test_enrichment_payload_columns_stamps_write_time():
+    """Test that payload columns carry the compacted payload and a UTC timestamp"""
+    columns = _enrichment_payload_columns({"emails": [], "domain": "acme.com", "email_status": "no_email_found"})
+
+    assert set(columns) == {"snov_payload", "snov_payload_updated_at"}
+    assert "domain" not in columns["snov_payload"]
+    assert columns["snov_payload_updated_at"].tzinfo == timezone.utc
+
+
+def test_verification_lookup_ignores_enrichment_cache(monkeypatch):
+    """Test that verification re-fetches domains cached by enrichment, then reuses its own short cache"""
+    calls = []
+
+    class FakeSnovIOClient:
+        async def domain_search(self, domain):
+            calls.append(domain)
+            return {"success": True, "emails": [{"value": f"info@{domain}"}], "call": len(calls)}
+
+    monkeypatch.setattr("app.clients.snov.SnovIOClient", FakeSnovIOClient)
+    monkeypatch.setattr(enrichment, "_SNOV_MIN_INTERVAL", 0.0)
+    caches = (enrichment._DOMAIN_SEARCH_CACHE, enrichment._DOMAIN_SEARCH_NEGATIVE_CACHE,
+              enrichment._VERIFICATION_DOMAIN_SEARCH_CACHE)
+    for cache in caches:
+        cache.clear()
+
+    async def run():
+        enriched = await enrichment._cached_domain_search("acme.com")
+        verified = await enrichment._verification_domain_search("acme.com")
+        verified_again = await enrichment._verification_domain_search("acme.com")
+        enriched_again = await enrichment._cached_domain_search("acme.com")
+        return enriched, verified, verified_again, enriched_again
+
+    try:
+        enriched, verified, verified_again, enriched_again = asyncio.run(run())
+    finally:
+        for cache in caches:
+            cache.clear()
+
+    assert calls == ["acme.com", "acme.com"], "Verification must not be served from the 7 day cache"
+    assert (enriched["call"], verified["call"], verified_again["call"]) == (1, 2, 2)
+    assert enriched_again["call"] == 2, "A fresh verification lookup also refreshes the enrichment cache"
@@ -0,0 +1,37 @@
+"""
+Unit tests for primary key generation utilities
+"""
+import uuid
+from app.utils import ids
+from app.utils.ids import uuid7
+
+
+def test_uuid7_version_and_variant():
+    """Test that uuid7 sets the version 7 and RFC 4122 variant bits"""
+    for _ in range(100):
+        value = uuid7()
+        assert value.version == 7, f"Wrong version: {value}"
+        assert value.variant == uuid.RFC_4122, f"Wrong variant: {value}"
+
+
+def test_uuid7_embeds_millisecond_timestamp(monkeypatch):
+    """Test that the top 48 bits hold the unix timestamp in milliseconds"""
+    monkeypatch.setattr(ids.time, "time_ns", lambda: 1_700_000_000_123_456_789)
+
+    assert uuid7().int >> 80 == 1_700_000_000_123
+
+
+def test_uuid7_orders_by_time(monkeypatch):
+    """Test that ids from later milliseconds sort after earlier ones"""
+    clock = iter(range(1_700_000_000_000, 1_700_000_000_050))
+    monkeypatch.setattr(ids.time, "time_ns", lambda: next(clock) * 1_000_000)
+
+    values = [uuid7() for _ in range(50)]
+    assert values == sorted(values)
+    assert [str(v) for v in values] == sorted(str(v) for v in values), "String form must sort the same way"
+
+
+def test_uuid7_unique():
+    """Test that ids generated in the same millisecond still differ"""
+    values = {uuid7() for _ in range(1000)}
+    assert len(values) == 1000
@@ -0,0 +1,192 @@
+"""
+Unit tests for schema validator result builders
+"""
+import asyncio
+import dataclasses
+import json
+import pytest
+from app.models.prospect import Prospect
+from app.utils import schema_validator
+from app.utils.schema_validator import (
+    REQUIRED_PROSPECT_COLUMNS,
+    WEBSITE_TABLES,
+    SOCIAL_TABLES,
+    SchemaValidationFailure,
+    SchemaValidationError,
+    _prospect_schema_result,
+    _tables_result,
+    _alembic_version_result,
+    validate_all_on_connection,
+)
+
+
+def test_prospect_schema_result_valid():
+    """Test that a table with every required column (plus extras) passes"""
+    db_columns = set(REQUIRED_PROSPECT_COLUMNS) | {"legacy_column"}
+    result = _prospect_schema_result(db_columns)
+
+    assert result["valid"]
+    assert result["missing_columns"] == []
+    assert result["existing_columns"] == sorted(db_columns)
+    assert result["error"] is None
+
+
+def test_prospect_schema_result_missing():
+    """Test that missing columns are reported sorted, with the real column list"""
+    db_columns = set(REQUIRED_PROSPECT_COLUMNS) - {"snov_payload", "contact_email"}
+    result = _prospect_schema_result(db_columns)
+
+    assert not result["valid"]
+    assert result["missing_columns"] == ["contact_email", "snov_payload"]
+    assert result["existing_columns"] == sorted(db_columns)
+    assert "2 required columns" in result["error"]
+
+
+def test_tables_result_all_present():
+    """Test that both table groups pass when every required table exists"""
+    result = _tables_result(set(WEBSITE_TABLES | SOCIAL_TABLES) | {"unrelated"})
+
+    assert result == {
+        "website": {"valid": True, "missing_tables": []},
+        "social": {"valid": True, "missing_tables": []},
+    }
+
+
+def test_tables_result_partitions_missing():
+    """Test that missing tables are reported sorted, under their own group"""
+    existing = set(WEBSITE_TABLES | SOCIAL_TABLES) - {"social_messages", "social_drafts"}
+    result = _tables_result(existing)
+
+    assert result["website"] == {"valid": True, "missing_tables": []}
+    assert result["social"] == {"valid": False, "missing_tables": ["social_drafts", "social_messages"]}
+
+
+def test_alembic_version_result():
+    """Test alembic_version presence, structure and current revision handling"""
+    missing = _alembic_version_result(False, set(), [])
+    assert not missing["valid"] and not missing["table_exists"]
+
+    empty = _alembic_version_result(True, {"version_num"}, [])
+    assert empty["valid"] and empty["current_version"] is None
+
+    current = _alembic_version_result(True, {"version_num"}, ["add_snov_payload_updated_at"])
+    assert current["current_version"] == "add_snov_payload_updated_at"
+
+    with pytest.raises(Exception, match="missing version_num column"):
+        _alembic_version_result(True, {"other"}, [])
+
+
+def test_required_columns_match_model():
+    """Test that the required column set is derived from the Prospect model"""
+    assert REQUIRED_PROSPECT_COLUMNS == {c.name for c in Prospect.__table__.columns}
+
+
+def test_schema_validation_failure_str():
+    """Test that failures render missing names sorted, or their detail"""
+    missing = SchemaValidationFailure("social_tables", missing=frozenset({"social_messages", "social_drafts"}))
+    assert str(missing) == "social_tables: missing 2: social_drafts, social_messages"
+
+    detail = SchemaValidationFailure("alembic_version", detail="table does not exist")
+    assert str(detail) == "alembic_version: table does not exist"
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        detail.check = "other"
+
+
+def test_schema_validation_error_collects_failures():
+    """Test that SchemaValidationError keeps every failure and joins them in str()"""
+    failures = [
+        SchemaValidationFailure("prospect_schema", missing=frozenset({"snov_payload"})),
+        SchemaValidationFailure("alembic_version", detail="table does not exist"),
+    ]
+    error = SchemaValidationError(failures, {"tables": {}})
+
+    assert error.failures == failures
+    assert error.results == {"tables": {}}
+    assert str(error) == "prospect_schema: missing 1: snov_payload; alembic_version: table does not exist"
+
+
+def test_prospect_schema_result_count_only():
+    """Test that a count-only pass (names not read) reports no column list"""
+    result = _prospect_schema_result(None)
+
+    assert result["valid"]
+    assert result["existing_columns"] is None
+
+
+class _CatalogConnection:
+    """In-memory stand-in for a fully migrated database, answering validate_all()'s queries"""
+
+    def __init__(self, versions):
+        self.versions = versions
+        self.settings = {}
+        self.executed = []
+
+    async def execute(self, statement, params=None):
+        self.executed.append(statement)
+        if statement is schema_validator._VALIDATION_CACHE_SQL:
+            cached = self.settings.get(params["key"], {})
+            rows = [(",".join(sorted(self.versions)), cached.get("alembic_version"), cached.get("required_hash"))]
+        elif statement is schema_validator._STORE_VALIDATION_CACHE_SQL:
+            self.settings[params["key"]] = json.loads(params["value"])
+            rows = []
+        elif statement is schema_validator._SCHEMA_SNAPSHOT_SQL:
+            rows = [("ncol", str(len(REQUIRED_PROSPECT_COLUMNS))), ("acol", "version_num")]
+            rows += [("tbl", table) for table in WEBSITE_TABLES | SOCIAL_TABLES]
+            rows += [("ver", version) for version in self.versions]
+        else:
+            raise AssertionError(f"Unexpected statement: {statement}")
+        return _Rows(rows)
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+class _Rows:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def fetchone(self):
+        return self.rows[0]
+
+    def fetchall(self):
+        return self.rows
+
+
+def test_validate_all_cache_round_trip():
+    """Test that a passing validate_all() stores a verdict the next run hits"""
+    conn = _CatalogConnection(["rev_b", "rev_a"])
+
+    first = asyncio.run(validate_all_on_connection(conn))
+    assert "cached" not in first["prospect_schema"]
+    assert conn.settings[schema_validator.VALIDATION_CACHE_KEY]["alembic_version"] == "rev_a,rev_b"
+
+    conn.executed.clear()
+    second = asyncio.run(validate_all_on_connection(conn))
+    assert second["prospect_schema"]["cached"]
+    assert second["alembic_version"]["current_version"] == "rev_a,rev_b"
+    assert conn.executed == [schema_validator._VALIDATION_CACHE_SQL], "Cache hit must skip the snapshot"
+
+
+def test_validate_all_without_cache_still_stores_verdict():
+    """Test that use_cache=False skips the lookup but still records a hit for later runs"""
+    conn = _CatalogConnection(["rev_a"])
+
+    asyncio.run(validate_all_on_connection(conn, use_cache=False))
+    assert schema_validator._VALIDATION_CACHE_SQL not in conn.executed
+
+    assert asyncio.run(validate_all_on_connection(conn))["prospect_schema"]["cached"]
+
+
+def test_validate_all_cache_misses_after_migration():
+    """Test that a new alembic revision invalidates the cached verdict"""
+    conn = _CatalogConnection(["rev_a"])
+    asyncio.run(validate_all_on_connection(conn))
+
+    conn.versions = ["rev_b"]
+    result = asyncio.run(validate_all_on_connection(conn))
+    assert "cached" not in result["prospect_schema"]
+    assert conn.settings[schema_validator.VALIDATION_CACHE_KEY]["alembic_version"] == "rev_b"